@@ -32,10 +32,16 @@ setup(
     ],
     python_requires=">=3.7",
     install_requires=[
-        "httpx>=0.24.0",
+        "httpx[http2]>=0.24.0",
         "typing-extensions>=4.0.0",
     ],
     extras_require={
+        "speedups": [
+            "orjson>=3.6.0",
+        ],
+        "large-responses": [
+            "ijson>=3.1.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
@@ -0,0 +1,1078 @@
+"""
+Tests for the TokenRouter Responses API client
+"""
+
+import asyncio
+import copy
+import dataclasses
+import gzip
+import json
+import sys
+import weakref
+import pytest
+from typing import Optional
+from unittest.mock import patch
+import httpx
+
+from tokenrouter import (
+    TokenRouter,
+    AsyncTokenRouter,
+    Response,
+    ResponseStreamEvent,
+    Usage,
+    TokenRouterError,
+    AuthenticationError,
+    RateLimitError,
+    InvalidRequestError,
+    APIStatusError,
+    APIConnectionError,
+    QuotaExceededError,
+)
+from tokenrouter.client import _SHARED_TRANSPORTS, _SSEDecoder, _SharedTransport
+from tokenrouter.types import CONTENT_ITEM_KEYS, INPUT_ITEM_KEYS, ResponseDelta, check_keys, hints_for, json_default
+
+
+def make_client(handler, **kwargs):
+    """Build a client whose HTTP traffic is served by ``handler``"""
+    client = TokenRouter(api_key="test-key", base_url="http://localhost:8000", **kwargs)
+    # Release the client's reference on the shared connection pool
+    client._client.close()
+    client._client = httpx.Client(
+        base_url=client.base_url,
+        headers=client._headers,
+        transport=httpx.MockTransport(handler),
+    )
+    return client
+
+
+def make_async_client(handler, **kwargs):
+    """Build an async client whose HTTP traffic is served by ``handler``"""
+    client = AsyncTokenRouter(api_key="test-key", base_url="http://localhost:8000", **kwargs)
+    # The replaced client has its own pool, which never opened a connection
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url,
+        headers=client._headers,
+        transport=httpx.MockTransport(handler),
+    )
+    return client
+
+
+class ChunkedStream(httpx.SyncByteStream):
+    """Byte stream that hands out one network read per chunk"""
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+
+    def __iter__(self):
+        yield from self._chunks
+
+
+def sse_stream(*chunks):
+    """Serve ``chunks`` as an event stream"""
+    def handler(request):
+        return httpx.Response(
+            200,
+            headers={"Content-Type": "text/event-stream"},
+            stream=ChunkedStream(chunks),
+        )
+    return handler
+
+
+RESPONSE_DATA = {
+    "id": "resp_123",
+    "object": "response",
+    "created": 1234567890,
+    "model": "gpt-4.1",
+    "status": "completed",
+    "output": [
+        {
+            "type": "message",
+            "content": [
+                {"type": "output_text", "text": "Hello"},
+                {"type": "output_text", "text": " world"},
+            ],
+        }
+    ],
+    "usage": {"input_tokens": 3, "output_tokens": 2, "total_tokens": 5},
+}
+
+
+def json_handler(data, status_code=200, calls=None, headers=None):
+    """Serve ``data`` as a JSON body, recording requests in ``calls``"""
+    def handler(request):
+        if calls is not None:
+            calls.append(request)
+        return httpx.Response(status_code, headers=headers, json=data)
+    return handler
+
+
+class TestResponses:
+    """Test non-streaming responses operations"""
+
+    def test_create(self):
+        """Test create builds a Response with output_text"""
+        calls = []
+        client = make_client(json_handler(RESPONSE_DATA, calls=calls))
+
+        response = client.responses.create(model="gpt-4.1", input="Hi")
+
+        assert response.id == "resp_123"
+        assert response.model == "gpt-4.1"
+        assert response.status == "completed"
+        assert response.usage.total_tokens == 5
+        assert response.output_text == "Hello world"
+        assert calls[0].url.path == "/v1/responses"
+        assert json.loads(calls[0].content) == {"model": "gpt-4.1", "input": "Hi"}
+
+    def test_create_omits_none_params(self):
+        """Test parameters set to None are left out of the request body"""
+        calls = []
+        client = make_client(json_handler(RESPONSE_DATA, calls=calls))
+        params = {"input": "Hi", "model": None, "temperature": None}
+
+        client.responses.create(params)
+
+        assert json.loads(calls[0].content) == {"input": "Hi"}
+        assert params == {"input": "Hi", "model": None, "temperature": None}
+
+    def test_create_non_str_metadata_keys(self):
+        """Test non-str dict keys are encoded as strings, with or without orjson"""
+        calls = []
+        client = make_client(json_handler(RESPONSE_DATA, calls=calls))
+
+        client.responses.create(input="Hi", metadata={1: "a"})
+
+        assert json.loads(calls[0].content)["metadata"] == {"1": "a"}
+
+    def test_get_and_cancel(self):
+        """Test get and cancel hit their endpoints"""
+        calls = []
+        client = make_client(json_handler(RESPONSE_DATA, calls=calls))
+
+        assert client.responses.get("resp_123").output_text == "Hello world"
+        assert client.responses.cancel("resp_123").id == "resp_123"
+        assert [(r.method, r.url.path) for r in calls] == [
+            ("GET", "/v1/responses/resp_123"),
+            ("POST", "/v1/responses/resp_123/cancel"),
+        ]
+
+    def test_delete(self):
+        """Test delete returns the confirmation body"""
+        client = make_client(json_handler({"id": "resp_123", "deleted": True}))
+
+        assert client.responses.delete("resp_123") == {"id": "resp_123", "deleted": True}
+
+    def test_delete_no_content(self):
+        """Test an empty 204 body is returned as an empty dict"""
+        client = make_client(lambda request: httpx.Response(204))
+
+        assert client.responses.delete("resp_123") == {}
+
+
+class TestCreateMany:
+    """Test concurrent creation of several responses"""
+
+    def test_create_many_preserves_order(self):
+        """Test results come back in request order"""
+        def handler(request):
+            body = json.loads(request.content)
+            return httpx.Response(200, json=dict(RESPONSE_DATA, id=body["input"]))
+
+        client = make_client(json_handler(RESPONSE_DATA))
+        client._async_client = make_async_client(handler)
+
+        try:
+            responses = client.responses.create_many(
+                [{"input": "resp_1"}, {"input": "resp_2"}, {"input": "resp_3"}]
+            )
+        finally:
+            client.close()
+
+        assert [r.id for r in responses] == ["resp_1", "resp_2", "resp_3"]
+        assert client._async_loop is None
+
+    def test_create_many_return_exceptions(self):
+        """Test failures are returned inline when requested"""
+        def handler(request):
+            if json.loads(request.content)["input"] == "bad":
+                return httpx.Response(400, json={"detail": "Bad input"})
+            return httpx.Response(200, json=RESPONSE_DATA)
+
+        client = make_client(json_handler(RESPONSE_DATA))
+        client._async_client = make_async_client(handler)
+
+        with client:
+            results = client.responses.create_many(
+                [{"input": "good"}, {"input": "bad"}], return_exceptions=True
+            )
+
+        assert results[0].id == "resp_123"
+        assert isinstance(results[1], InvalidRequestError)
+
+    def test_create_many_forwards_max_concurrency(self):
+        """Test the sync client's max_concurrency reaches its background async client"""
+        client = make_client(json_handler(RESPONSE_DATA), max_concurrency=3)
+
+        async def read_limit(async_client):
+            return async_client.max_concurrency
+
+        with client:
+            assert client._run_async(read_limit) == 3
+
+    def test_create_many_rejects_streaming(self):
+        """Test streaming requests are refused"""
+        client = make_client(json_handler(RESPONSE_DATA))
+        client._async_client = make_async_client(json_handler(RESPONSE_DATA))
+
+        with client, pytest.raises(InvalidRequestError):
+            client.responses.create_many([{"input": "Hi", "stream": True}])
+
+
+class TestSharedConnections:
+    """Test connection pool sharing between clients"""
+
+    @pytest.fixture(autouse=True)
+    def no_env_proxies(self, monkeypatch):
+        for name in ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY"):
+            monkeypatch.delenv(name, raising=False)
+            monkeypatch.delenv(name.lower(), raising=False)
+
+    def test_clients_share_pool_until_last_close(self):
+        """Test clients with the same settings share one pool"""
+        limits = httpx.Limits(max_connections=7)
+        first = TokenRouter(api_key="a", pool_limits=limits)
+        second = TokenRouter(api_key="b", pool_limits=limits)
+        pool = first._client._transport._transport
+
+        assert second._client._transport._transport is pool
+
+        first.close()
+        assert second._client._transport._transport is pool
+
+        second.close()
+        third = TokenRouter(api_key="c", pool_limits=limits)
+        assert third._client._transport._transport is not pool
+        third.close()
+
+    def test_make_client_releases_shared_pool(self):
+        """Test the test helper does not leave references on the shared pool"""
+        before = {key: entry[1] for key, entry in _SHARED_TRANSPORTS.items()}
+
+        make_client(json_handler(RESPONSE_DATA)).close()
+
+        assert {key: entry[1] for key, entry in _SHARED_TRANSPORTS.items()} == before
+
+    def test_sharing_disabled(self):
+        """Test share_connections=False gives the client its own pool"""
+        limits = httpx.Limits(max_connections=7)
+        shared = TokenRouter(api_key="a", pool_limits=limits)
+        private = TokenRouter(api_key="b", pool_limits=limits, share_connections=False)
+
+        assert isinstance(private._client._transport, httpx.HTTPTransport)
+
+        private.close()
+        shared.close()
+
+    def test_proxy_env_disables_sharing(self, monkeypatch):
+        """Test clients behind an environment proxy keep httpx's proxy routing"""
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.internal:3128")
+        client = TokenRouter(api_key="a")
+
+        assert not isinstance(client._client._transport, _SharedTransport)
+        assert client._client._mounts
+
+        client.close()
+
+    def test_async_client_uses_env_proxy(self, monkeypatch):
+        """Test the async client keeps httpx's proxy routing"""
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.internal:3128")
+        client = AsyncTokenRouter(api_key="a")
+
+        assert client._client._mounts
+
+        asyncio.run(client.close())
+
+
+class TestResponseCache:
+    """Test the opt-in cache for responses.get()"""
+
+    def test_get_served_from_cache(self):
+        """Test a finished response is only fetched once"""
+        calls = []
+        client = make_client(json_handler(RESPONSE_DATA, calls=calls), response_cache_ttl=60)
+
+        first = client.responses.get("resp_123")
+        second = client.responses.get("resp_123")
+
+        assert second == first
+        assert len(calls) == 1
+
+    def test_cached_response_not_shared(self):
+        """Test changing a returned response does not affect later cache hits"""
+        client = make_client(json_handler(RESPONSE_DATA), response_cache_ttl=60)
+
+        first = client.responses.get("resp_123")
+        first.status = "tampered"
+        first.output.append({"type": "message", "content": []})
+        second = client.responses.get("resp_123")
+
+        assert second is not first
+        assert second.status == "completed"
+        assert second.output == RESPONSE_DATA["output"]
+
+    def test_in_progress_not_cached(self):
+        """Test responses that can still change are refetched"""
+        calls = []
+        data = dict(RESPONSE_DATA, status="in_progress")
+        client = make_client(json_handler(data, calls=calls), response_cache_ttl=60)
+
+        client.responses.get("resp_123")
+        client.responses.get("resp_123")
+
+        assert len(calls) == 2
+
+    def test_delete_invalidates(self):
+        """Test delete drops the cached response"""
+        calls = []
+        client = make_client(json_handler(RESPONSE_DATA, calls=calls), response_cache_ttl=60)
+
+        client.responses.get("resp_123")
+        client.responses.delete("resp_123")
+        client.responses.get("resp_123")
+
+        assert [c.method for c in calls] == ["GET", "DELETE", "GET"]
+
+    def test_disabled_by_default(self):
+        """Test get always hits the API without a TTL"""
+        calls = []
+        client = make_client(json_handler(RESPONSE_DATA, calls=calls))
+
+        client.responses.get("resp_123")
+        client.responses.get("resp_123")
+
+        assert len(calls) == 2
+
+
+class TestLargeResponses:
+    """Test incremental decoding of large response bodies"""
+
+    def test_large_body_decoded_incrementally(self):
+        """Test bodies over the threshold are parsed as they stream in"""
+        pytest.importorskip("ijson")
+        body = json.dumps(RESPONSE_DATA).encode()
+
+        def handler(request):
+            return httpx.Response(
+                200,
+                headers={"Content-Length": str(len(body))},
+                stream=ChunkedStream([body[i:i + 16] for i in range(0, len(body), 16)]),
+            )
+
+        client = make_client(handler, large_response_threshold_bytes=64)
+
+        with patch("tokenrouter.client.loads") as mock_loads:
+            response = client.responses.get("resp_123")
+
+        mock_loads.assert_not_called()
+        assert response.usage.total_tokens == 5
+        assert response.output_text == "Hello world"
+
+    def test_small_body_buffered(self):
+        """Test bodies under the threshold use the buffered decoder"""
+        pytest.importorskip("ijson")
+        client = make_client(json_handler(RESPONSE_DATA), large_response_threshold_bytes=1 << 20)
+
+        assert client.responses.get("resp_123").output_text == "Hello world"
+
+    def test_large_body_error_status(self):
+        """Test error responses are still raised with the threshold set"""
+        pytest.importorskip("ijson")
+        client = make_client(
+            json_handler({"detail": "Not found"}, status_code=404),
+            large_response_threshold_bytes=1,
+        )
+
+        with pytest.raises(TokenRouterError) as exc_info:
+            client.responses.get("resp_missing")
+
+        assert exc_info.value.status_code == 404
+
+
+class TestErrors:
+    """Test error responses are mapped to exceptions"""
+
+    def test_error_handling_401(self):
+        """Test 401 raises AuthenticationError with the API detail"""
+        client = make_client(json_handler({"detail": "Invalid API key"}, status_code=401))
+
+        with pytest.raises(AuthenticationError) as exc_info:
+            client.responses.create(input="Hello")
+        assert "Invalid API key" in str(exc_info.value)
+        assert exc_info.value.status_code == 401
+
+    def test_error_handling_403_quota(self):
+        """Test 403 quota errors raise QuotaExceededError"""
+        client = make_client(json_handler({"error": "Monthly quota exceeded"}, status_code=403))
+
+        with pytest.raises(QuotaExceededError):
+            client.responses.get("resp_123")
+
+    def test_error_handling_403_forbidden(self):
+        """Test other 403 errors raise AuthenticationError"""
+        client = make_client(json_handler({"error": "Forbidden"}, status_code=403))
+
+        with pytest.raises(AuthenticationError) as exc_info:
+            client.responses.get("resp_123")
+        assert not isinstance(exc_info.value, QuotaExceededError)
+
+    def test_error_handling_unlisted_server_status(self):
+        """Test any status of 500 and up, including non-standard ones, raises APIStatusError"""
+        client = make_client(json_handler({"detail": "Odd"}, status_code=600), max_retries=0)
+
+        with pytest.raises(APIStatusError) as exc_info:
+            client.responses.get("resp_123")
+        assert exc_info.value.status_code == 600
+
+    def test_error_handling_non_json_body(self):
+        """Test non-JSON error bodies fall back to the response text"""
+        client = make_client(lambda request: httpx.Response(404, text="<html>Not Found</html>"))
+
+        with pytest.raises(TokenRouterError) as exc_info:
+            client.responses.get("resp_missing")
+        assert exc_info.value.message == "<html>Not Found</html>"
+        assert exc_info.value.response is None
+        assert exc_info.value.status_code == 404
+
+    def test_error_handling_large_html_body(self):
+        """Test huge non-JSON error pages are truncated in the message"""
+        page = "<html>" + "x" * 100000 + "</html>"
+        client = make_client(lambda request: httpx.Response(502, text=page), max_retries=0)
+
+        with pytest.raises(APIStatusError) as exc_info:
+            client.responses.get("resp_123")
+        assert exc_info.value.message == page[:4096]
+
+    def test_stream_error_status(self):
+        """Test error status on a stream request is raised before iteration"""
+        client = make_client(json_handler({"detail": "Missing input"}, status_code=400))
+
+        with pytest.raises(InvalidRequestError) as exc_info:
+            list(client.responses.create(stream=True))
+        assert exc_info.value.response == {"detail": "Missing input"}
+
+
+def sequence_handler(*responses, calls=None):
+    """Serve ``responses`` in order, one per request"""
+    pending = list(responses)
+
+    def handler(request):
+        if calls is not None:
+            calls.append(request)
+        return pending.pop(0)
+    return handler
+
+
+class TestRetries:
+    """Test retry behavior of _request"""
+
+    def test_retry_on_500_errors(self):
+        """Test 5xx responses are retried until one succeeds"""
+        client = make_client(sequence_handler(
+            httpx.Response(500, json={"detail": "Server error"}),
+            httpx.Response(502, json={"detail": "Bad gateway"}),
+            httpx.Response(200, json=RESPONSE_DATA),
+        ), max_retries=3)
+
+        with patch("time.sleep") as sleep:
+            response = client.responses.create(input="Hello")
+
+        assert response.id == "resp_123"
+        assert sleep.call_count == 2
+        assert all(0 <= call.args[0] <= 30.0 for call in sleep.call_args_list)
+
+    def test_retry_resends_built_request(self):
+        """Test retries resend the same request instead of rebuilding it"""
+        calls = []
+        client = make_client(sequence_handler(
+            httpx.Response(500, json={"detail": "Server error"}),
+            httpx.Response(200, json=RESPONSE_DATA),
+            calls=calls,
+        ))
+
+        with patch("time.sleep"):
+            client.responses.create(input="Hello")
+
+        assert len(calls) == 2
+        assert calls[0] is calls[1]
+
+    def test_negative_max_retries_sends_once(self):
+        """Test a negative max_retries still sends the request once"""
+        calls = []
+        client = make_client(json_handler(RESPONSE_DATA, calls=calls), max_retries=-1)
+
+        assert client.responses.create(input="Hello").id == "resp_123"
+        assert len(calls) == 1
+
+    def test_retries_exhausted(self):
+        """Test the last 5xx error is raised once retries run out"""
+        calls = []
+        client = make_client(
+            json_handler({"detail": "Server error"}, status_code=503, calls=calls),
+            max_retries=2,
+        )
+
+        with patch("time.sleep"):
+            with pytest.raises(APIStatusError):
+                client.responses.create(input="Hello")
+        assert len(calls) == 3
+
+    def test_429_honors_retry_after(self):
+        """Test 429 waits for Retry-After before retrying"""
+        client = make_client(sequence_handler(
+            httpx.Response(429, headers={"Retry-After": "7"}, json={"detail": "Slow down"}),
+            httpx.Response(200, json=RESPONSE_DATA),
+        ))
+
+        with patch("time.sleep") as sleep:
+            client.responses.create(input="Hello")
+
+        sleep.assert_called_once_with(7.0)
+
+    def test_429_long_retry_after_raises(self):
+        """Test a Retry-After beyond the backoff cap raises instead of sleeping"""
+        calls = []
+        client = make_client(json_handler(
+            {"detail": "Slow down"}, status_code=429, headers={"Retry-After": "86400"}, calls=calls,
+        ))
+
+        with patch("time.sleep") as sleep:
+            with pytest.raises(RateLimitError) as exc_info:
+                client.responses.create(input="Hello")
+
+        assert exc_info.value.retry_after == 86400
+        assert len(calls) == 1
+        sleep.assert_not_called()
+
+    def test_429_non_finite_retry_after_ignored(self):
+        """Test Retry-After values like inf fall back to the normal backoff"""
+        client = make_client(json_handler(
+            {"detail": "Slow down"}, status_code=429, headers={"Retry-After": "inf"},
+        ), max_retries=1)
+
+        with patch("time.sleep") as sleep:
+            with pytest.raises(RateLimitError) as exc_info:
+                client.responses.create(input="Hello")
+
+        assert exc_info.value.retry_after is None
+        assert 0 <= sleep.call_args.args[0] <= 30.0
+
+    def test_429_raised_without_retries(self):
+        """Test 429 raises RateLimitError when retries are disabled"""
+        client = make_client(
+            lambda request: httpx.Response(
+                429, headers={"Retry-After": "60"}, json={"detail": "Rate limit exceeded"}
+            ),
+            max_retries=0,
+        )
+
+        with pytest.raises(RateLimitError) as exc_info:
+            client.responses.create(input="Hello")
+        assert exc_info.value.retry_after == 60
+        assert type(exc_info.value.headers) is dict
+        assert exc_info.value.headers["retry-after"] == "60"
+
+    def test_connect_error_retried(self):
+        """Test connection failures are retried"""
+        attempts = []
+
+        def handler(request):
+            attempts.append(request)
+            if len(attempts) == 1:
+                raise httpx.ConnectError("Connection refused", request=request)
+            return httpx.Response(200, json=RESPONSE_DATA)
+
+        client = make_client(handler)
+
+        with patch("time.sleep") as sleep:
+            response = client.responses.create(input="Hello")
+
+        assert response.id == "resp_123"
+        assert len(attempts) == 2
+        assert sleep.call_count == 1
+
+    def test_read_timeout_retried_for_get_only(self):
+        """Test read timeouts are retried unless the request creates something"""
+        attempts = []
+
+        def handler(request):
+            attempts.append(request)
+            if len(attempts) == 1:
+                raise httpx.ReadTimeout("Timed out", request=request)
+            return httpx.Response(200, json=RESPONSE_DATA)
+
+        client = make_client(handler)
+        with patch("time.sleep"):
+            assert client.responses.get("resp_123").id == "resp_123"
+        assert len(attempts) == 2
+
+        attempts.clear()
+        with patch("time.sleep"):
+            with pytest.raises(APIConnectionError):
+                client.responses.create(input="Hello")
+        assert len(attempts) == 1
+
+    def test_4xx_not_retried(self):
+        """Test client errors are raised without retrying"""
+        calls = []
+        client = make_client(json_handler({"detail": "Bad"}, status_code=400, calls=calls))
+
+        with pytest.raises(InvalidRequestError):
+            client.responses.create(input="Hello")
+        assert len(calls) == 1
+
+
+class TestStreaming:
+    """Test SSE stream parsing"""
+
+    def test_stream_text_deltas(self):
+        """Test text deltas split across network reads are reassembled"""
+        body = (
+            b'data: {"index": 0, "delta": {"type": "text", "text": "Hel"}}\n\n'
+            b'data: {"index": 0, "delta": {"type": "text", "text": "lo"}}\r\n\r\n'
+            b"data: [DONE]\n\n"
+        )
+        client = make_client(sse_stream(body[:17], body[17:60], body[60:]))
+
+        events = list(client.responses.create(input="Hi", stream=True))
+
+        texts = [e.delta.output[0]["content"][0]["text"] for e in events if e.delta]
+        assert texts == ["Hel", "lo"]
+        assert [e.delta.text_delta for e in events if e.delta] == ["Hel", "lo"]
+        assert events[-1].type == "done"
+
+    def test_stream_cr_line_endings(self):
+        """Test bare CR line endings end events without waiting for the stream to close"""
+        decoder = _SSEDecoder()
+
+        events = decoder.feed(b'data: {"total_tokens": 1}\r\rdata: {"total_tokens": 2}\r')
+
+        assert [e.type for e in events] == ["usage"]
+        assert [e.type for e in decoder.feed(b"\r")] == []
+        assert [e.type for e in decoder.feed(b"event: x\n")] == ["usage"]
+
+    def test_stream_crlf_split_across_chunks(self):
+        """Test a CRLF split between reads is one line ending, not two"""
+        decoder = _SSEDecoder()
+
+        assert decoder.feed(b'data: {"index": 0, "delta": {"type": "text", "text": "a"}}\r') == []
+        assert decoder.feed(b"\ndata: {\"total_tokens\": 5}\r") == []
+        events = decoder.feed(b"\n\r\ndata: [DONE]\r\n\r\n")
+
+        # Both data lines belong to one event, which is not valid JSON
+        assert [e.type for e in events] == ["done"]
+
+    def test_stream_unhashable_payload_type(self):
+        """Test a payload whose type is not a string becomes a generic event"""
+        body = b'data: {"type": ["response.delta"], "item": {"id": "x"}}\n\n'
+        client = make_client(sse_stream(body))
+
+        events = list(client.responses.create(input="Hi", stream=True))
+
+        assert events[0].type == ["response.delta"]
+        assert events[0].item == {"id": "x"}
+
+    def test_stream_invalid_utf8_field(self):
+        """Test undecodable event/id fields are replaced rather than raised"""
+        body = b'event: bad\xff\nid: \xfe1\ndata: {"total_tokens": 5}\n\n'
+        client = make_client(sse_stream(body))
+
+        events = list(client.responses.create(input="Hi", stream=True))
+
+        assert events[0].type == "usage"
+        assert events[0].event_id == "\ufffd1"
+
+    def test_stream_event_and_id_fields(self):
+        """Test event/id fields and multi-line data payloads"""
+        body = (
+            b"event: response.created\n"
+            b"id: evt_1\n"
+            b'data: {"response": {"id": "resp_1",\n'
+            b'data: "status": "in_progress"}}\n\n'
+            b": keep-alive comment\n\n"
+            b'data: {"type": "response.completed", "response": {"id": "resp_1", '
+            b'"output": [{"type": "message", "content": [{"type": "output_text", "text": "ok"}]}]}}'
+        )
+        client = make_client(sse_stream(body))
+
+        events = list(client.responses.create(input="Hi", stream=True))
+
+        assert [e.type for e in events] == ["response.created", "response.completed"]
+        assert events[0].event_id == "evt_1"
+        assert events[0].response.status == "in_progress"
+        assert events[1].response.output_text == "ok"
+
+    def test_stream_one_byte_per_read(self):
+        """Test frames and CRLF terminators split at every byte boundary"""
+        body = (
+            b'event: response.created\r\ndata: {"response": {"id": "resp_1"}}\r\n\r\n'
+            b'data: {"index": 0, "delta": {"type": "text", "text": "\xc3\xa9t\xc3\xa9"}}\r\n\r\n'
+            b"data: [DONE]\r\n\r\n"
+            b'data: {"type": "ignored.after.done"}\r\n\r\n'
+        )
+        client = make_client(sse_stream(*(body[i:i + 1] for i in range(len(body)))))
+
+        events = list(client.responses.create(input="Hi", stream=True))
+
+        assert [e.type for e in events] == ["response.created", "response.delta", "done"]
+        assert events[1].delta.output[0]["content"][0]["text"] == "\u00e9t\u00e9"
+
+    def test_stream_requests_identity_and_decodes_gzip(self):
+        """Test streams ask for an uncompressed body but still handle gzip"""
+        calls = []
+        body = gzip.compress(b'data: {"type": "response.created"}\n\n')
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(
+                200,
+                headers={"Content-Type": "text/event-stream", "Content-Encoding": "gzip"},
+                stream=ChunkedStream([body]),
+            )
+
+        client = make_client(handler)
+
+        events = list(client.responses.create(input="Hi", stream=True))
+
+        assert calls[0].headers["Accept-Encoding"] == "identity"
+        assert [e.type for e in events] == ["response.created"]
+
+    def test_stream_lifecycle_events(self):
+        """Test response lifecycle events match by SSE event or payload type"""
+        body = (
+            b'event: response.created\ndata: {"response": {"id": "resp_1", "status": "in_progress"}}\n\n'
+            b'data: {"type": "response.completed", "event_id": "evt_2", "metadata": {"k": "v"},'
+            b' "response": {"id": "resp_1", "status": "completed"}}\n\n'
+            b'event: response.completed\ndata: {"delta": {"output": []}}\n\n'
+        )
+        client = make_client(sse_stream(body))
+
+        events = list(client.responses.create(input="Hi", stream=True))
+
+        assert [e.type for e in events] == ["response.created", "response.completed", "response.completed"]
+        assert events[0].response.status == "in_progress"
+        assert events[1].response.status == "completed"
+        assert events[1].event_id == "evt_2"
+        assert events[1].metadata == {"k": "v"}
+        assert events[1].raw["type"] == "response.completed"
+        assert events[2].delta.output == []
+
+    def test_stream_skips_invalid_json(self):
+        """Test malformed data frames are dropped"""
+        body = b"data: {not json\n\n" + b'data: {"type": "response.in_progress"}\n\n'
+        client = make_client(sse_stream(body))
+
+        events = list(client.responses.create(input="Hi", stream=True))
+
+        assert [e.type for e in events] == ["response.in_progress"]
+
+    def test_stream_usage_and_list_payloads(self):
+        """Test bare usage stats and delta arrays get their fallback types"""
+        body = (
+            b'data: [{"type": "message", "content": []}]\n\n'
+            b'data: {"input_tokens": 3, "output_tokens": 2, "total_tokens": 5}\n\n'
+            b'data: "unexpected"\n\n'
+        )
+        client = make_client(sse_stream(body))
+
+        events = list(client.responses.create(input="Hi", stream=True))
+
+        assert [e.type for e in events] == ["response.delta", "usage", "unknown"]
+        assert events[0].delta.output == [{"type": "message", "content": []}]
+
+    def test_bare_events_shared_unless_identified(self):
+        """Test type-only events are reused, but not when they carry an id"""
+        body = (
+            b'data: {"total_tokens": 5}\n\n'
+            b'data: {"total_tokens": 6}\n\n'
+            b'id: evt_9\ndata: {"total_tokens": 7}\n\n'
+        )
+        client = make_client(sse_stream(body))
+
+        events = list(client.responses.create(input="Hi", stream=True))
+
+        assert events[0] is events[1]
+        assert events[0].event_id is None
+        assert events[2] is not events[0]
+        assert events[2].event_id == "evt_9"
+        assert ResponseStreamEvent.bare("usage") is events[0]
+
+    def test_shared_events_are_read_only(self):
+        """Test a shared event cannot be mutated, so no stream sees another's changes"""
+        event = ResponseStreamEvent.bare("usage")
+
+        with pytest.raises(AttributeError):
+            event.metadata = {"tenant": "A"}
+        assert ResponseStreamEvent.bare("usage").metadata is None
+        assert event == ResponseStreamEvent(type="usage")
+        assert repr(event) == repr(ResponseStreamEvent(type="usage"))
+        assert copy.copy(event) is event
+
+        modified = dataclasses.replace(event, metadata={"tenant": "A"})
+        assert modified.metadata == {"tenant": "A"}
+        assert json.loads(json.dumps(event, default=json_default))["type"] == "usage"
+
+
+class AsyncChunkedStream(httpx.AsyncByteStream):
+    """Async byte stream that hands out one network read per chunk"""
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+
+    async def __aiter__(self):
+        for chunk in self._chunks:
+            yield chunk
+
+
+class TestAsyncClient:
+    """Test asynchronous client"""
+
+    @pytest.mark.asyncio
+    async def test_async_create(self):
+        """Test async create builds a Response"""
+        calls = []
+        async with make_async_client(json_handler(RESPONSE_DATA, calls=calls)) as client:
+            response = await client.responses.create(model="gpt-4.1", input="Hi")
+
+        assert response.id == "resp_123"
+        assert response.output_text == "Hello world"
+        assert calls[0].url.path == "/v1/responses"
+
+    @pytest.mark.asyncio
+    async def test_async_max_concurrency(self):
+        """Test requests beyond max_concurrency wait for a free slot"""
+        in_flight = []
+        peak = []
+
+        async def handler(request):
+            in_flight.append(request)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(request)
+            return httpx.Response(200, json=RESPONSE_DATA)
+
+        async with make_async_client(handler, max_concurrency=2) as client:
+            responses = await client.responses.create_many([{"input": "Hi"}] * 6)
+
+        assert len(responses) == 6
+        assert max(peak) == 2
+
+    @pytest.mark.asyncio
+    async def test_async_retry_on_500_errors(self):
+        """Test async requests retry 5xx responses"""
+        client = make_async_client(sequence_handler(
+            httpx.Response(500, json={"detail": "Server error"}),
+            httpx.Response(200, json=RESPONSE_DATA),
+        ))
+
+        with patch("asyncio.sleep") as sleep:
+            response = await client.responses.get("resp_123")
+        await client.close()
+
+        assert response.id == "resp_123"
+        assert sleep.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_async_error_handling(self):
+        """Test async error responses raise mapped exceptions"""
+        client = make_async_client(json_handler({"detail": "Invalid API key"}, status_code=401))
+
+        with pytest.raises(AuthenticationError):
+            await client.responses.delete("resp_123")
+        with pytest.raises(AuthenticationError):
+            stream = await client.responses.create(input="Hi", stream=True)
+            async for _ in stream:
+                pass
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_async_stream(self):
+        """Test async streams decode SSE frames across reads"""
+        body = (
+            b'data: {"index": 0, "delta": {"type": "text", "text": "Hel"}}\n\n'
+            b'data: {"index": 0, "delta": {"type": "text", "text": "lo"}}\n\n'
+            b"data: [DONE]\n\n"
+        )
+
+        def handler(request):
+            return httpx.Response(200, stream=AsyncChunkedStream([body[:30], body[30:]]))
+
+        async with make_async_client(handler) as client:
+            stream = await client.responses.create(input="Hi", stream=True)
+            events = [event async for event in stream]
+
+        texts = [e.delta.output[0]["content"][0]["text"] for e in events if e.delta]
+        assert texts == ["Hel", "lo"]
+        assert events[-1].type == "done"
+
+
+class TestTypes:
+    """Test response types"""
+
+    def test_stream_types_use_slots(self):
+        """Test per-event types carry no instance __dict__"""
+        event = ResponseStreamEvent(type="response.delta", delta=ResponseDelta(output=[]))
+
+        assert not hasattr(event, "__dict__")
+        assert not hasattr(event.delta, "__dict__")
+        assert event == ResponseStreamEvent(type="response.delta", delta=ResponseDelta(output=[]))
+        assert ResponseStreamEvent(type="done").metadata is None
+        with pytest.raises(AttributeError):
+            event.extra = True
+
+    def test_response_uses_slots(self):
+        """Test Response carries no instance __dict__ and survives copying"""
+        response = Response.from_dict(RESPONSE_DATA)
+
+        assert not hasattr(response, "__dict__")
+        with pytest.raises(AttributeError):
+            response.extra = True
+        clone = copy.copy(response)
+        assert clone == response
+        assert clone.output_text == "Hello world"
+
+    def test_slotted_types_support_weakrefs(self):
+        """Test the slotted types can still be weakly referenced"""
+        for obj in (
+            Response.from_dict(RESPONSE_DATA),
+            ResponseDelta(text_delta="Hi"),
+            ResponseStreamEvent(type="response.delta"),
+            ResponseStreamEvent.bare("usage"),
+        ):
+            assert weakref.ref(obj)() is obj
+
+    def test_usage_fields(self):
+        """Test Usage reads as attributes and as a tuple"""
+        usage = Response.from_dict(RESPONSE_DATA).usage
+
+        assert isinstance(usage, Usage)
+        input_tokens, output_tokens, total_tokens = usage[:3]
+        assert (input_tokens, output_tokens, total_tokens) == (3, 2, 5)
+        assert usage.total_tokens == usage._asdict()["total_tokens"] == 5
+        assert Usage.from_dict({}).total_tokens == 0
+        assert Usage.from_dict({"total_tokens": None}).total_tokens == 0
+
+    def test_output_text_computed_on_access(self):
+        """Test output_text is joined from output unless set explicitly"""
+        response = Response(id="resp_1", output=RESPONSE_DATA["output"])
+
+        assert response.output_text == "Hello world"
+        assert "output_text='Hello world'" in repr(response)
+        assert Response(id="resp_1", output_text="preset").output_text == "preset"
+        assert Response(id="resp_1").output_text == ""
+
+    def test_response_from_dict_defaults(self):
+        """Test from_dict fills in defaults for missing fields"""
+        response = Response.from_dict({"id": "resp_1"})
+
+        assert response.id == "resp_1"
+        assert response.object == "realtime.response"
+        assert response.output == []
+        assert response.usage is None
+        assert Response.from_dict(RESPONSE_DATA).output_text == "Hello world"
+
+    def test_from_dict_missing_output(self):
+        """Test a missing or null output becomes an empty list"""
+        assert Response.from_dict({"id": "resp_1"}).output == []
+        assert Response.from_dict({"id": "resp_1", "output": None}).output == []
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="match needs Python 3.10+")
+    def test_stream_event_match_args(self):
+        """Test positional class patterns match on the event type"""
+        # Compiled at runtime so the module still imports on older Pythons
+        namespace = {"ResponseStreamEvent": ResponseStreamEvent}
+        exec(
+            "def kind(event):\n"
+            "    match event:\n"
+            "        case ResponseStreamEvent('response.delta'):\n"
+            "            return 'delta'\n"
+            "        case ResponseStreamEvent('usage'):\n"
+            "            return 'usage'\n"
+            "        case _:\n"
+            "            return 'other'\n",
+            namespace,
+        )
+        kind = namespace["kind"]
+
+        assert kind(ResponseStreamEvent(type="response.delta")) == "delta"
+        assert kind(ResponseStreamEvent.bare("usage")) == "usage"
+        assert kind(ResponseStreamEvent(type="response.completed")) == "other"
+
+    def test_hints_for(self):
+        """Test hints_for resolves postponed annotations once"""
+        hints = hints_for(ResponseStreamEvent)
+
+        assert hints["delta"] == Optional[ResponseDelta]
+        assert hints_for(ResponseStreamEvent) is hints
+
+    def test_response_to_json_bytes(self):
+        """Test to_json_bytes encodes usage as an object and round-trips"""
+        response = Response.from_dict(RESPONSE_DATA)
+
+        data = json.loads(response.to_json_bytes())
+
+        assert data["usage"]["total_tokens"] == 5
+        assert data["output_text"] == "Hello world"
+        assert Response.from_json(response.to_json_bytes()) == response
+
+    def test_response_init(self):
+        """Test Response defaults, explicit output_text and dataclasses.replace"""
+        first, second = Response("resp_1"), Response("resp_2")
+        assert first.output == [] and first.output is not second.output
+        assert Response("resp_1", output_text="Hi").output_text == "Hi"
+
+        response = dataclasses.replace(Response.from_dict(RESPONSE_DATA), status="failed")
+        assert response.status == "failed"
+        assert response.output_text == "Hello world"
+
+    def test_json_default(self):
+        """Test json_default encodes nested events, responses and usage"""
+        response = Response.from_dict(RESPONSE_DATA)
+        event = ResponseStreamEvent(type="response.completed", response=response)
+
+        data = json.loads(json.dumps(event, default=json_default))
+
+        assert data["response"]["usage"]["total_tokens"] == 5
+        assert data["response"]["output_text"] == "Hello world"
+        with pytest.raises(TypeError):
+            json_default(object())
+
+    def test_check_keys(self):
+        """Test check_keys accepts known keys and rejects unknown ones"""
+        check_keys({"type": "message", "role": "user"}, INPUT_ITEM_KEYS)
+
+        with pytest.raises(InvalidRequestError, match="Unknown input item keys: colour"):
+            check_keys({"type": "message", "colour": "red"}, INPUT_ITEM_KEYS, "input item")
+        check_keys({"type": "input_text", "text": "Hi"}, CONTENT_ITEM_KEYS)
+
+    def test_response_from_json(self):
+        """Test from_json decodes raw bytes straight into a Response"""
+        response = Response.from_json(json.dumps(RESPONSE_DATA).encode())
+
+        assert response == Response.from_dict(RESPONSE_DATA)
+
+    def test_to_dict_matches_asdict(self):
+        """Test to_dict matches dataclasses.asdict, with usage as a dict"""
+        response = Response.from_dict(RESPONSE_DATA)
+        event = ResponseStreamEvent(
+            type="response.completed",
+            response=response,
+            delta=ResponseDelta(output=[]),
+            event_id="evt_1",
+        )
+
+        expected = dataclasses.asdict(response)
+        expected["usage"] = response.usage._asdict()
+
+        assert response.to_dict() == expected
+        assert event.to_dict() == dict(dataclasses.asdict(event), response=expected)
+        assert json.loads(json.dumps(response.to_dict()))["usage"]["total_tokens"] == 5
@@ -2,7 +2,7 @@
 TokenRouter SDK - OpenAI Responses API Compatible Client
 """
 
-from .client import TokenRouter
+from .client import TokenRouter, AsyncTokenRouter
 from .errors import (
     TokenRouterError,
     AuthenticationError,
@@ -23,11 +23,13 @@ from .types import (
     FunctionCall,
     Tool,
     FunctionTool,
+    Usage,
 )
 
 __version__ = "1.0.15"
 __all__ = [
     "TokenRouter",
+    "AsyncTokenRouter",
     "TokenRouterError",
     "AuthenticationError",
     "RateLimitError",
@@ -45,6 +47,7 @@ __all__ = [
     "FunctionCall",
     "Tool",
     "FunctionTool",
+    "Usage",
 ]
 
 # Default export for OpenAI-like usage
@@ -0,0 +1,52 @@
+"""
+JSON helpers for TokenRouter SDK
+
+Uses orjson when it is installed and falls back to the standard library.
+"""
+
+try:
+    import orjson
+
+    loads = orjson.loads
+    JSONDecodeError = orjson.JSONDecodeError
+
+    def dumps(obj, default=None) -> bytes:
+        """Encode ``obj`` as compact UTF-8 JSON, accepting non-str dict keys like json.dumps"""
+        return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    import json
+
+    loads = json.loads
+    JSONDecodeError = json.JSONDecodeError
+
+    def dumps(obj, default=None) -> bytes:
+        """Encode ``obj`` as compact UTF-8 JSON, like orjson.dumps"""
+        return json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False,
+            default=default,
+        ).encode("utf-8")
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+class IncrementalObjectDecoder:
+    """
+    Decode a top-level JSON object from chunks as they arrive
+
+    Requires ijson. Each chunk is parsed and released as soon as it is fed,
+    so the raw body is never buffered in full.
+    """
+
+    def __init__(self):
+        self._items = ijson.sendable_list()
+        self._coro = ijson.kvitems_coro(self._items, "", use_float=True)
+
+    def feed(self, chunk: bytes) -> None:
+        self._coro.send(chunk)
+
+    def close(self) -> dict:
+        self._coro.close()
+        return dict(self._items)
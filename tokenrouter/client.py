@@ -4,19 +4,25 @@ OpenAI Responses API Compatible
 """
 
 import os
-import json
+import math
 import time
-from typing import Optional, Dict, Any, AsyncIterator, Iterator, Union, List, Tuple
-from dataclasses import asdict
+import random
+import asyncio
+import threading
+import urllib.request
+from typing import (
+    Optional, Dict, Any, AsyncIterator, Awaitable, Callable, Iterator, Union, List, Tuple
+)
 import httpx
 
+from ._json import loads, dumps, JSONDecodeError, IncrementalObjectDecoder, ijson
 from .types import (
     ResponsesCreateParams,
     Response,
     ResponseStreamEvent,
-    OutputItem,
     InputItemsList,
     ResponseDelta,
+    TYPE_TEXT,
 )
 from .errors import (
     TokenRouterError,
@@ -28,9 +34,587 @@ from .errors import (
     QuotaExceededError,
 )
 
+# Event types assigned by the stream parser when a payload does not carry one
+_EVENT_DELTA = "response.delta"
+_EVENT_USAGE = "usage"
+_EVENT_UNKNOWN = "unknown"
+_EVENT_DEFAULT = "event"
+_EVENT_DONE = "done"
+
+# Keys that mark a bare usage statistics payload
+_USAGE_KEYS = frozenset(("input_tokens", "output_tokens", "total_tokens"))
+
+# SSE field prefixes and the end-of-stream sentinel, matched on raw bytes
+_DATA_PREFIX = b"data:"
+_DATA_PREFIX_LEN = len(_DATA_PREFIX)
+_EVENT_PREFIX = b"event:"
+_EVENT_PREFIX_LEN = len(_EVENT_PREFIX)
+_ID_PREFIX = b"id:"
+_ID_PREFIX_LEN = len(_ID_PREFIX)
+_DONE_SENTINEL = b"[DONE]"
+
+# Headers sent with every request, whatever the client configuration
+_BASE_HEADERS = (
+    ("Content-Type", "application/json"),
+    ("User-Agent", "tokenrouter-python/1.0.9"),
+)
+
+# Connection pool used unless the caller passes pool_limits. Every
+# connection may stay warm, so bursts of requests do not pay for new
+# TCP/TLS handshakes once the pool has grown; with HTTP/2 each connection
+# also carries many concurrent requests.
+_DEFAULT_POOL_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=100,
+    keepalive_expiry=60.0,
+)
+
+# Extra headers for event streams. Compression gains little on small SSE
+# frames, so ask for the body uncompressed and read it without decoding.
+# Normalized once here, like the client headers, rather than per stream.
+_STREAM_HEADERS = httpx.Headers({"Accept-Encoding": "identity"})
+
+# Exception raised for each API error status; other statuses of 500 and
+# up raise APIStatusError and anything else TokenRouterError. A 403 whose
+# message mentions the quota is refined to QuotaExceededError in
+# _handle_error_response.
+_STATUS_EXC = {
+    400: InvalidRequestError,
+    401: AuthenticationError,
+    403: AuthenticationError,
+    429: RateLimitError,
+}
+
+# Longest prefix of a non-JSON error body used as the exception message
+_ERROR_TEXT_MAX_BYTES = 4096
+
+# Response statuses after which a stored response no longer changes
+_FINAL_STATUSES = frozenset(("completed", "failed", "cancelled", "incomplete"))
+
+# Retry backoff bounds, in seconds
+_RETRY_BASE_DELAY = 0.5
+_RETRY_MAX_DELAY = 30.0
+
+# Transport errors raised before a request reaches the server, which are
+# always safe to retry
+_CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds"""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        return None
+    # float() also accepts "inf" and "nan"
+    if not math.isfinite(seconds):
+        return None
+    return max(seconds, 0.0)
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with full jitter, so concurrent clients do not retry in lockstep"""
+    return random.uniform(0, min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * 2 ** attempt))
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> Optional[float]:
+    """Seconds to wait before retrying a failed request, or None if it should not be retried"""
+    status_code = response.status_code
+    if status_code != 429 and status_code < 500:
+        return None
+    delay = _backoff_delay(attempt)
+    # Never retry sooner than the server asked, but rather than block for
+    # longer than the backoff cap, raise and let the caller decide
+    retry_after = _parse_retry_after(response.headers.get("retry-after"))
+    if retry_after is not None:
+        if retry_after > _RETRY_MAX_DELAY:
+            return None
+        if retry_after > delay:
+            delay = retry_after
+    return delay
+
+
+def _retry_error_delay(error: httpx.TransportError, method: str, attempt: int) -> Optional[float]:
+    """Seconds to wait before retrying after a transport error, or None if it should not be retried"""
+    # A timeout after the request was sent may mean the server is already
+    # working on it, so only resend requests that do not create anything
+    if isinstance(error, _CONNECT_ERRORS) or (
+        isinstance(error, httpx.TimeoutException) and method != "POST"
+    ):
+        return _backoff_delay(attempt)
+    return None
+
+
+def _error_text(response: httpx.Response) -> str:
+    """Error body as text, capped so huge error pages are not decoded in full"""
+    text = response.content[:_ERROR_TEXT_MAX_BYTES]
+    try:
+        return text.decode(response.charset_encoding or "utf-8", errors="replace")
+    except LookupError:
+        # Unknown charset in the Content-Type header
+        return text.decode("utf-8", errors="replace")
+
+
+def _handle_error_response(response: httpx.Response) -> None:
+    """Handle error responses from API"""
+    status_code = response.status_code
+    content = response.content
+    try:
+        data = loads(content)
+    except (JSONDecodeError, UnicodeDecodeError):
+        data = None
+    if isinstance(data, dict):
+        message = data.get("detail") or data.get("error") or _error_text(response)
+    else:
+        data = None
+        message = _error_text(response) or response.reason_phrase
+
+    # The exception copies the headers into a dict only if they are read
+    headers = response.headers
+
+    exc_class = _STATUS_EXC.get(status_code) or (
+        APIStatusError if status_code >= 500 else TokenRouterError
+    )
+    if exc_class is RateLimitError:
+        retry_after = _parse_retry_after(response.headers.get("retry-after"))
+        raise RateLimitError(
+            message, status_code, data, headers,
+            int(retry_after) if retry_after is not None else None
+        )
+    if status_code == 403 and "quota" in message.lower():
+        exc_class = QuotaExceededError
+    raise exc_class(message, status_code, data, headers)
+
+
+def _parse_text_delta(
+    data: Dict[str, Any], event_type: Optional[str], event_id: Optional[str]
+) -> Optional[ResponseStreamEvent]:
+    """Parse the simple text delta format, or return None for any other payload"""
+    # {'index': 0, 'delta': {'type': 'text', 'text': 'Hello'}}
+    if "delta" not in data or "index" not in data:
+        return None
+    delta_content = data["delta"]
+    if not isinstance(delta_content, dict):
+        return None
+    delta_get = delta_content.get
+    if delta_get("type") != TYPE_TEXT:
+        return None
+    # Only the text is kept; ResponseDelta builds the message item around it
+    # if the caller reads delta.output
+    return ResponseStreamEvent(
+        type=event_type or _EVENT_DELTA,
+        delta=ResponseDelta(text_delta=delta_get("text", "")),
+        event_id=event_id,
+    )
+
+
+def _parse_response_event(
+    data: Dict[str, Any], event_type: Optional[str], event_id: Optional[str]
+) -> ResponseStreamEvent:
+    """Parse a response lifecycle event such as response.created or response.completed"""
+    # These carry a response snapshot and no delta; anything else takes
+    # the general path
+    if "delta" in data or not data.keys().isdisjoint(_USAGE_KEYS):
+        return _parse_event(data, event_type, event_id)
+    dg = data.get
+    payload_event_id = dg("event_id")
+    return ResponseStreamEvent(
+        type=dg("type") or event_type or _EVENT_DEFAULT,
+        response=Response.from_dict(data["response"]) if "response" in data else None,
+        item=dg("item"),
+        event_id=payload_event_id if payload_event_id is not None else event_id,
+        rate_limits=dg("rate_limits"),
+        metadata=dg("metadata"),
+        raw=data,
+    )
+
+
+def _parse_event(
+    data: Dict[str, Any], event_type: Optional[str], event_id: Optional[str]
+) -> ResponseStreamEvent:
+    """Parse any event payload"""
+    event = _parse_text_delta(data, event_type, event_id)
+    if event is not None:
+        return event
+
+    # Handle usage stats
+    if not data.keys().isdisjoint(_USAGE_KEYS):
+        # This is a usage update
+        return ResponseStreamEvent.bare(_EVENT_USAGE, event_id)
+
+    # Standard response event handling
+    dg = data.get
+    event = ResponseStreamEvent(type=dg("type") or event_type or _EVENT_DEFAULT)
+
+    if "response" in data:
+        event.response = Response.from_dict(data["response"])
+
+    if "delta" in data and "index" not in data:
+        delta_data = data["delta"]
+        # Handle delta data which could be dict or already processed
+        if isinstance(delta_data, dict):
+            event.delta = ResponseDelta(
+                output=delta_data.get("output"),
+            )
+        else:
+            event.delta = ResponseDelta(output=delta_data)
+
+    if "item" in data:
+        event.item = data["item"]
+
+    payload_event_id = dg("event_id")
+    event.event_id = payload_event_id if payload_event_id is not None else event_id
+    event.rate_limits = dg("rate_limits")
+    event.metadata = dg("metadata")
+    event.raw = data
+
+    return event
+
 
-class TokenRouter:
-    """TokenRouter client - OpenAI Responses API compatible"""
+def _parse_delta_event(
+    data: Dict[str, Any], event_type: Optional[str], event_id: Optional[str]
+) -> ResponseStreamEvent:
+    """Parse an event sent as response.delta, which is almost always a text delta"""
+    event = _parse_text_delta(data, event_type, event_id)
+    if event is not None:
+        return event
+    return _parse_event(data, event_type, event_id)
+
+
+# Parsers specialized for known event types, keyed on the SSE event field
+# or, failing that, the payload's own type. Other events take _parse_event.
+_EVENT_PARSERS = {
+    _EVENT_DELTA: _parse_delta_event,
+    "response.created": _parse_response_event,
+    "response.in_progress": _parse_response_event,
+    "response.completed": _parse_response_event,
+    "response.failed": _parse_response_event,
+    "response.incomplete": _parse_response_event,
+    "response.cancelled": _parse_response_event,
+}
+
+
+def _parse_stream_event(
+    data: Any,
+    event_type: Optional[str] = None,
+    event_id: Optional[str] = None,
+) -> ResponseStreamEvent:
+    """Parse streaming event data"""
+    # JSON decoders only produce exact dicts and lists, so check the type
+    # by identity and leave isinstance() for unusual subclasses
+    data_type = type(data)
+    if data_type is not dict and data_type is not list:
+        if isinstance(data, dict):
+            data_type = dict
+        elif isinstance(data, list):
+            data_type = list
+        else:
+            # Fallback for None or other unexpected data
+            return ResponseStreamEvent.bare(event_type or _EVENT_UNKNOWN, event_id)
+
+    # Handle case where data is a list (delta chunks)
+    if data_type is list:
+        # This is a delta output array
+        return ResponseStreamEvent(
+            type=event_type or _EVENT_DELTA,
+            delta=ResponseDelta(output=data),
+            event_id=event_id,
+        )
+
+    key = event_type or data.get("type")
+    # The payload's type is only a lookup key if it is a string; lists and
+    # other unhashable values take the generic path
+    if not isinstance(key, str):
+        return _parse_event(data, event_type, event_id)
+    parser = _EVENT_PARSERS.get(key, _parse_event)
+    return parser(data, event_type, event_id)
+
+
+class _SSEDecoder:
+    """Incremental decoder turning server-sent event bytes into stream events"""
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+        self._event_type: Optional[str] = None
+        self._event_id: Optional[str] = None
+        self._data_lines: List[bytearray] = []
+        # Set once the [DONE] sentinel has been decoded
+        self.done = False
+
+    def feed(self, chunk: bytes) -> List[ResponseStreamEvent]:
+        """Decode the events completed by a chunk of the response body"""
+        # Every event completed by the chunk is parsed in one tight loop and
+        # handed back as a list, so the caller can yield them back-to-back
+        # without resuming a nested generator per event
+        events: List[ResponseStreamEvent] = []
+        buf = self._buf
+        buf += chunk
+        # Cut every complete line out of the buffer and split them with one
+        # C-level split() call, rather than searching for each newline from
+        # Python; an incomplete trailing line stays buffered. Lines may end
+        # in \n, \r\n or a bare \r; a \r at the very end of the buffer
+        # may be the first half of a \r\n, so it waits for the next chunk.
+        limit = len(buf)
+        if buf.endswith(b"\r"):
+            limit -= 1
+        end = max(buf.rfind(b"\n", 0, limit), buf.rfind(b"\r", 0, limit)) + 1
+        if not end:
+            return events
+        block = buf[:end]
+        del buf[:end]
+        if b"\r" in block:
+            block = block.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        lines = block.split(b"\n")
+        # The block ends with a newline, leaving an empty last element
+        lines.pop()
+
+        # Bind the methods used for every line once per chunk
+        append = self._data_lines.append
+        flush = self._flush
+        add_event = events.append
+        for line in lines:
+            if not line:
+                event = flush()
+                if event:
+                    add_event(event)
+                if self.done:
+                    break
+                append = self._data_lines.append
+            elif line.startswith(_DATA_PREFIX):
+                append(line[_DATA_PREFIX_LEN:].lstrip())
+            else:
+                self._process_line(line)
+        return events
+
+    def close(self) -> List[ResponseStreamEvent]:
+        """Decode whatever is left once the response body ends"""
+        # A trailing line without a newline terminator still counts
+        if self._buf:
+            line = self._buf.rstrip(b"\r")
+            if line.startswith(_DATA_PREFIX):
+                self._data_lines.append(line[_DATA_PREFIX_LEN:].lstrip())
+            self._buf = bytearray()
+
+        # Flush any buffered event after the stream ends
+        event = self._flush()
+        return [event] if event else []
+
+    def _process_line(self, line: bytearray) -> None:
+        # data lines are handled inline by feed(); this covers the rest
+        if line.startswith(_EVENT_PREFIX):
+            self._event_type = line[_EVENT_PREFIX_LEN:].strip().decode("utf-8", errors="replace")
+        elif line.startswith(_ID_PREFIX):
+            self._event_id = line[_ID_PREFIX_LEN:].strip().decode("utf-8", errors="replace")
+
+    def _flush(self) -> Optional[ResponseStreamEvent]:
+        data_lines = self._data_lines
+        event_type = self._event_type
+        event_id = self._event_id
+        self._event_type = None
+        self._event_id = None
+
+        if not data_lines:
+            return None
+
+        # Almost every frame carries a single data line, which can be
+        # decoded as-is without joining
+        if len(data_lines) == 1:
+            data = data_lines[0]
+        else:
+            data = b"\n".join(data_lines)
+        self._data_lines = []
+
+        if data == _DONE_SENTINEL:
+            self.done = True
+            return ResponseStreamEvent.bare(event_type or _EVENT_DONE, event_id or None)
+
+        # loads accepts UTF-8 bytes directly, so the payload never has to
+        # be materialized as an intermediate str
+        try:
+            payload = loads(data)
+        except (JSONDecodeError, UnicodeDecodeError):
+            return None
+
+        return _parse_stream_event(payload, event_type, event_id or None)
+
+
+def _create_request_params(
+    params: Optional[Union[ResponsesCreateParams, Dict[str, Any]]],
+    kwargs: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Resolve create() parameters given as a dict or as keyword arguments
+
+    Parameters set to None are left out of the payload, so optional
+    arguments can be passed through without checking them first.
+    """
+    # Handle both dict params and keyword arguments; either way the result
+    # is a new dict, so the caller's params are never modified
+    source = kwargs if params is None else params
+    return {key: value for key, value in source.items() if value is not None}
+
+
+class _ResponseCache:
+    """
+    Bounded TTL cache of finished responses, keyed by response ID
+
+    Responses are stored encoded and decoded afresh on every hit, so callers
+    (possibly in other threads) never share one mutable Response, and
+    changing a returned response cannot affect later get() calls.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 128):
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._entries: Dict[str, Tuple[float, bytes]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, response_id: str) -> Optional[Response]:
+        with self._lock:
+            entry = self._entries.get(response_id)
+            if entry is None:
+                return None
+            expires_at, body = entry
+            if expires_at <= time.monotonic():
+                del self._entries[response_id]
+                return None
+        return Response.from_json(body)
+
+    def put(self, response: Response) -> None:
+        # Queued and in-progress responses still change between calls, so
+        # only responses that reached a final status are cached
+        if not response.id or response.status not in _FINAL_STATUSES:
+            return
+        body = response.to_json_bytes()
+        with self._lock:
+            if response.id not in self._entries and len(self._entries) >= self._maxsize:
+                # Evict the oldest entry
+                del self._entries[next(iter(self._entries))]
+            self._entries[response.id] = (time.monotonic() + self._ttl, body)
+
+    def discard(self, response_id: str) -> None:
+        with self._lock:
+            self._entries.pop(response_id, None)
+
+
+def _proxies_from_env() -> bool:
+    """Whether proxy environment variables, which httpx would honour, are set"""
+    proxies = urllib.request.getproxies()
+    return any(scheme in proxies for scheme in ("http", "https", "all"))
+
+
+# Connection pools shared between TokenRouter instances, keyed on their
+# transport settings: key -> [transport, number of clients using it]
+_SHARED_TRANSPORTS: Dict[Tuple[Any, ...], List[Any]] = {}
+_SHARED_TRANSPORTS_LOCK = threading.Lock()
+
+
+class _SharedTransport(httpx.BaseTransport):
+    """
+    Handle on a connection pool shared by clients with the same settings
+
+    Clients created per request (as in many web handlers) then reuse warm
+    connections instead of opening new ones. The pool is closed when the
+    last client using it is closed.
+    """
+
+    def __init__(self, verify: Any, http2: bool, limits: httpx.Limits):
+        key = (
+            verify, http2,
+            limits.max_connections, limits.max_keepalive_connections, limits.keepalive_expiry,
+        )
+        with _SHARED_TRANSPORTS_LOCK:
+            entry = _SHARED_TRANSPORTS.get(key)
+            if entry is None:
+                transport = httpx.HTTPTransport(
+                    verify=verify, http2=http2, limits=limits, retries=0
+                )
+                entry = _SHARED_TRANSPORTS[key] = [transport, 0]
+            entry[1] += 1
+        self._key = key
+        self._transport: Optional[httpx.HTTPTransport] = entry[0]
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self._transport.handle_request(request)
+
+    def close(self) -> None:
+        with _SHARED_TRANSPORTS_LOCK:
+            if self._transport is None:
+                return
+            self._transport = None
+            entry = _SHARED_TRANSPORTS[self._key]
+            entry[1] -= 1
+            if entry[1]:
+                return
+            del _SHARED_TRANSPORTS[self._key]
+        entry[0].close()
+
+
+class _BaseClient:
+    """Configuration shared by the sync and async clients"""
+
+    def __init__(
+        self,
+        api_key: Optional[str],
+        base_url: Optional[str],
+        timeout: Optional[float],
+        max_retries: int,
+        headers: Optional[Dict[str, str]],
+        response_cache_ttl: Optional[float],
+        large_response_threshold_bytes: Optional[int],
+    ):
+        self.api_key = api_key or os.environ.get("TOKENROUTER_API_KEY", "")
+        if not self.api_key:
+            raise AuthenticationError(
+                "API key is required. Set TOKENROUTER_API_KEY environment variable or pass api_key parameter."
+            )
+
+        self.base_url = (
+            base_url or os.environ.get("TOKENROUTER_BASE_URL", "https://api.tokenrouter.io")
+        ).rstrip("/")
+        self.timeout = timeout
+        self.max_retries = max_retries
+
+        # Set up headers once as normalized httpx.Headers so the client
+        # does not have to re-normalize a plain dict
+        self._headers = httpx.Headers(_BASE_HEADERS)
+        self._headers["Authorization"] = f"Bearer {self.api_key}"
+        if headers:
+            self._headers.update(headers)
+
+        self._response_cache = (
+            _ResponseCache(response_cache_ttl) if response_cache_ttl else None
+        )
+
+        if large_response_threshold_bytes is not None and ijson is None:
+            raise ImportError(
+                "large_response_threshold_bytes requires ijson. "
+                "Install it with: pip install 'tokenrouter[large-responses]'"
+            )
+        self._large_response_threshold = large_response_threshold_bytes
+
+    def _is_large_response(self, response: httpx.Response) -> bool:
+        """Whether a successful response body should be decoded incrementally"""
+        if response.status_code >= 400:
+            return False
+        content_length = response.headers.get("content-length")
+        return (
+            content_length is not None
+            and content_length.isdigit()
+            and int(content_length) > self._large_response_threshold
+        )
+
+
+class TokenRouter(_BaseClient):
+    """
+    TokenRouter client - OpenAI Responses API compatible
+
+    The client keeps a pool of warm connections and is safe to share
+    between threads. Create one per application and reuse it, rather
+    than creating a client per request.
+    """
 
     def __init__(
         self,
@@ -40,6 +624,12 @@ class TokenRouter:
         max_retries: int = 3,
         headers: Optional[Dict[str, str]] = None,
         verify_ssl: bool = True,
+        http2: bool = True,
+        pool_limits: Optional[httpx.Limits] = None,
+        response_cache_ttl: Optional[float] = None,
+        large_response_threshold_bytes: Optional[int] = None,
+        share_connections: bool = True,
+        max_concurrency: Optional[int] = None,
     ):
         """
         Initialize TokenRouter client
@@ -51,94 +641,131 @@ class TokenRouter:
             max_retries: Maximum number of retries for failed requests
             headers: Additional headers to include in requests
             verify_ssl: Whether to verify SSL certificates (set False for testing)
+            http2: Whether to use HTTP/2, so concurrent requests (including
+                streams) are multiplexed over one connection
+            pool_limits: Connection pool limits. Defaults to 100 connections,
+                all of which are kept alive for up to 60 seconds between requests
+            response_cache_ttl: Seconds to cache finished responses returned by
+                responses.get(). Disabled by default
+            large_response_threshold_bytes: Decode response bodies larger than
+                this many bytes incrementally while they download, instead of
+                buffering them first. Requires ijson. Disabled by default
+            share_connections: Whether to share the connection pool with other
+                TokenRouter instances using the same verify_ssl, http2 and
+                pool_limits settings. Ignored when proxy environment
+                variables are set
+            max_concurrency: Maximum number of requests from one
+                responses.create_many() call in flight at once; further
+                requests wait for a free slot. Unlimited by default
         """
-        self.api_key = api_key or os.environ.get("TOKENROUTER_API_KEY", "")
-        if not self.api_key:
-            raise AuthenticationError(
-                "API key is required. Set TOKENROUTER_API_KEY environment variable or pass api_key parameter."
-            )
-
-        self.base_url = (
-            base_url or os.environ.get("TOKENROUTER_BASE_URL", "https://api.tokenrouter.io")
-        ).rstrip("/")
-        self.timeout = timeout
-        self.max_retries = max_retries
+        super().__init__(
+            api_key, base_url, timeout, max_retries, headers,
+            response_cache_ttl, large_response_threshold_bytes,
+        )
 
-        # Set up headers
-        self._headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "User-Agent": "tokenrouter-python/1.0.9",
-        }
-        if headers:
-            self._headers.update(headers)
+        # Create HTTP client. Retries are handled by _request; httpx's own
+        # transport does not retry by default.
+        limits = pool_limits or _DEFAULT_POOL_LIMITS
+        # httpx only honours proxy environment variables for the transports
+        # it creates itself, so clients behind a proxy get their own pool
+        if share_connections and not _proxies_from_env():
+            self._client = httpx.Client(
+                base_url=self.base_url,
+                timeout=timeout,
+                headers=self._headers,
+                transport=_SharedTransport(verify_ssl, http2, limits),
+            )
+        else:
+            self._client = httpx.Client(
+                base_url=self.base_url,
+                timeout=timeout,
+                headers=self._headers,
+                verify=verify_ssl,
+                http2=http2,
+                limits=limits,
+            )
 
-        # Create HTTP client
-        self._client = httpx.Client(
+        # Async client and background event loop backing create_many(),
+        # created on first use
+        self._async_options = dict(
+            api_key=self.api_key,
             base_url=self.base_url,
             timeout=timeout,
-            headers=self._headers,
-            verify=verify_ssl,
+            max_retries=max_retries,
+            headers=headers,
+            verify_ssl=verify_ssl,
+            http2=http2,
+            pool_limits=pool_limits,
+            large_response_threshold_bytes=large_response_threshold_bytes,
+            max_concurrency=max_concurrency,
         )
+        self._async_client: Optional["AsyncTokenRouter"] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_thread: Optional[threading.Thread] = None
+        self._async_lock = threading.Lock()
 
         # Create responses namespace
         self.responses = ResponsesNamespace(self)
 
-    def _handle_error_response(self, response: httpx.Response) -> None:
-        """Handle error responses from API"""
-        status_code = response.status_code
-        try:
-            data = response.json()
-            message = data.get("detail") or data.get("error") or response.text
-        except:
-            data = None
-            message = response.text or response.reason_phrase
-
-        headers = dict(response.headers)
-
-        if status_code == 401:
-            raise AuthenticationError(message, status_code, data, headers)
-        elif status_code == 429:
-            retry_after = response.headers.get("retry-after")
-            raise RateLimitError(
-                message, status_code, data, headers,
-                int(retry_after) if retry_after else None
-            )
-        elif status_code == 400:
-            raise InvalidRequestError(message, status_code, data, headers)
-        elif status_code == 403:
-            if "quota" in message.lower():
-                raise QuotaExceededError(message, status_code, data, headers)
-            raise AuthenticationError(message, status_code, data, headers)
-        elif status_code >= 500:
-            raise APIStatusError(message, status_code, data, headers)
-        else:
-            raise TokenRouterError(message, status_code, data, headers)
-
     def _request(
         self,
         method: str,
         path: str,
         json_data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
-        retry_count: int = 0,
     ) -> Any:
         """Make HTTP request with retries"""
+        # Build the request, and encode its body, once; retries resend it.
+        # The body is encoded by our own (orjson when available) encoder
+        # rather than httpx's json= argument, which uses the json module
+        request = self._client.build_request(
+            method=method,
+            url=path,
+            content=dumps(json_data) if json_data is not None else None,
+            params=params,
+        )
+        # With a large response threshold, look at the headers before
+        # reading the body, so large bodies can be parsed chunk by chunk
+        incremental = self._large_response_threshold is not None
         try:
-            response = self._client.request(
-                method=method,
-                url=path,
-                json=json_data,
-                params=params,
-            )
-
-            if response.status_code >= 400:
-                if retry_count < self.max_retries and response.status_code >= 500:
-                    time.sleep(2 ** retry_count)
-                    return self._request(method, path, json_data, params, retry_count + 1)
-                self._handle_error_response(response)
+            for attempt in range(max(self.max_retries, 0) + 1):
+                try:
+                    response = self._client.send(request, stream=incremental)
+                    if incremental:
+                        try:
+                            if self._is_large_response(response):
+                                decoder = IncrementalObjectDecoder()
+                                for chunk in response.iter_bytes():
+                                    decoder.feed(chunk)
+                                return decoder.close()
+                            response.read()
+                        finally:
+                            response.close()
+                except httpx.TransportError as e:
+                    wait = (
+                        _retry_error_delay(e, method, attempt)
+                        if attempt < self.max_retries else None
+                    )
+                    if wait is None:
+                        raise
+                    time.sleep(wait)
+                    continue
+
+                if response.status_code < 400:
+                    content = response.content
+                    # 204 No Content and other empty bodies (typically from
+                    # DELETE) have nothing to decode
+                    if not content:
+                        return {}
+                    return loads(content)
+
+                if attempt < self.max_retries:
+                    wait = _retry_delay(response, attempt)
+                    if wait is not None:
+                        time.sleep(wait)
+                        continue
 
-            return response.json()
+                _handle_error_response(response)
 
         except httpx.TimeoutException:
             raise APIConnectionError("Request timed out")
@@ -159,83 +786,28 @@ class TokenRouter:
             with self._client.stream(
                 method=method,
                 url=path,
-                json=json_data,
+                content=dumps(json_data) if json_data is not None else None,
                 params=params,
+                headers=_STREAM_HEADERS,
             ) as response:
                 if response.status_code >= 400:
-                    self._handle_error_response(response)
-                event_type: Optional[str] = None
-                event_id: Optional[str] = None
-                data_lines: List[str] = []
-
-                def flush_event() -> Tuple[Optional[ResponseStreamEvent], bool]:
-                    nonlocal event_type, event_id, data_lines
-
-                    if not data_lines:
-                        event_type = None
-                        event_id = None
-                        return None, False
-
-                    data = "\n".join(data_lines)
-                    data_lines = []
-
-                    if data == "[DONE]":
-                        done_event = ResponseStreamEvent(type=event_type or "done")
-                        if event_id:
-                            done_event.event_id = event_id
-                        event_type = None
-                        event_id = None
-                        return done_event, True
-
-                    try:
-                        payload = json.loads(data)
-                    except json.JSONDecodeError:
-                        event_type = None
-                        event_id = None
-                        return None, False
-
-                    event = self._parse_stream_event(payload, event_type)
-                    if event_id and getattr(event, "event_id", None) is None:
-                        event.event_id = event_id
-
-                    event_type = None
-                    event_id = None
-                    return event, False
-
-                for raw_line in response.iter_lines():
-                    if isinstance(raw_line, bytes):
-                        line = raw_line.decode("utf-8")
-                    else:
-                        line = raw_line
-
-                    line = line.rstrip("\r")
-
-                    if line == "":
-                        event, should_stop = flush_event()
-                        if event:
-                            yield event
-                        if should_stop:
-                            return
-                        continue
-
-                    if line.startswith("event:"):
-                        event_type = line[6:].strip()
-                        continue
-
-                    if line.startswith("id:"):
-                        event_id = line[3:].strip()
-                        continue
-
-                    if line.startswith("data:"):
-                        data_lines.append(line[5:].lstrip())
-                        continue
-
-                # Flush any buffered event after the stream ends
-                event, should_stop = flush_event()
-                if event:
-                    yield event
-                if should_stop:
-                    return
+                    response.read()
+                    _handle_error_response(response)
+
+                # Uncompressed bodies are read raw, skipping httpx's content
+                # decoding layer
+                if response.headers.get("content-encoding", "identity") == "identity":
+                    chunks = response.iter_raw()
+                else:
+                    chunks = response.iter_bytes()
+
+                decoder = _SSEDecoder()
+                feed = decoder.feed
+                for chunk in chunks:
+                    yield from feed(chunk)
+                    if decoder.done:
+                        return
+                yield from decoder.close()
 
         except httpx.TimeoutException:
             raise APIConnectionError("Request timed out")
@@ -244,89 +816,44 @@ class TokenRouter:
         except httpx.HTTPError as e:
             raise TokenRouterError(f"Request failed: {str(e)}")
 
-    def _parse_stream_event(self, data: Any, event_type: Optional[str] = None) -> ResponseStreamEvent:
-        """Parse streaming event data"""
-        # Handle case where data is a list (delta chunks)
-        if isinstance(data, list):
-            # This is a delta output array
-            event = ResponseStreamEvent(type=event_type or "response.delta")
-            event.delta = ResponseDelta(output=data)
-            return event
-
-        # Handle None or other non-dict data
-        if not isinstance(data, dict):
-            # Fallback for unexpected data
-            event = ResponseStreamEvent(type=event_type or "unknown")
-            return event
-
-        # Handle simple delta format: {'index': 0, 'delta': {'type': 'text', 'text': 'Hello'}}
-        if "delta" in data and "index" in data:
-            delta_content = data["delta"]
-            if isinstance(delta_content, dict) and delta_content.get("type") == "text":
-                # Create a proper output structure for text delta
-                output_item = {
-                    "type": "message",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": delta_content.get("text", "")
-                        }
-                    ]
-                }
-                event = ResponseStreamEvent(type=event_type or "response.delta")
-                event.delta = ResponseDelta(output=[output_item])
-                return event
-
-        # Handle usage stats
-        if "input_tokens" in data or "output_tokens" in data or "total_tokens" in data:
-            # This is a usage update
-            event = ResponseStreamEvent(type="usage")
-            return event
-
-        # Standard response event handling
-        event = ResponseStreamEvent(type=data.get("type") or event_type or "event")
-
-        if "response" in data:
-            response_data = data["response"]
-            event.response = Response(
-                id=response_data.get("id", ""),
-                object=response_data.get("object", "realtime.response"),
-                created=response_data.get("created"),
-                model=response_data.get("model"),
-                usage=response_data.get("usage"),
-                output=response_data.get("output", []),
-                metadata=response_data.get("metadata"),
-                status=response_data.get("status"),
-                status_details=response_data.get("status_details"),
-            )
-
-        if "delta" in data and "index" not in data:
-            delta_data = data["delta"]
-            # Handle delta data which could be dict or already processed
-            if isinstance(delta_data, dict):
-                event.delta = ResponseDelta(
-                    output=delta_data.get("output"),
+    def _run_async(self, func: Callable[["AsyncTokenRouter"], Awaitable[Any]]) -> Any:
+        """Run ``func(async_client)`` on the background event loop and wait for the result"""
+        with self._async_lock:
+            if self._async_loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="tokenrouter-async", daemon=True
                 )
-            else:
-                event.delta = ResponseDelta(output=delta_data)
-
-        if "item" in data:
-            event.item = data["item"]
-
-        event.event_id = data.get("event_id")
-        event.rate_limits = data.get("rate_limits")
-        event.metadata = data.get("metadata")
-        event.raw = data
-
-        if event.type == "response.completed" and event.response:
-            event.response.output_text = self._extract_output_text(event.response)
-
-        return event
+                thread.start()
+                self._async_loop = loop
+                self._async_thread = thread
+            if self._async_client is None:
+                self._async_client = AsyncTokenRouter(**self._async_options)
+            # A concurrent close() may reset the attributes once the lock
+            # is released, so keep our own references
+            async_client = self._async_client
+            loop = self._async_loop
+
+        future = asyncio.run_coroutine_threadsafe(func(async_client), loop)
+        return future.result()
 
     def close(self):
         """Close the HTTP client"""
         self._client.close()
 
+        with self._async_lock:
+            loop = self._async_loop
+            if loop is None:
+                return
+            if self._async_client is not None:
+                asyncio.run_coroutine_threadsafe(self._async_client.close(), loop).result()
+                self._async_client = None
+            loop.call_soon_threadsafe(loop.stop)
+            self._async_thread.join()
+            loop.close()
+            self._async_loop = None
+            self._async_thread = None
+
     def __enter__(self):
         return self
 
@@ -334,6 +861,210 @@ class TokenRouter:
         self.close()
 
 
+class AsyncTokenRouter(_BaseClient):
+    """
+    Asynchronous TokenRouter client - OpenAI Responses API compatible
+
+    Create one per application (and event loop) and reuse it, rather than
+    creating a client per request.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        timeout: Optional[float] = 60.0,
+        max_retries: int = 3,
+        headers: Optional[Dict[str, str]] = None,
+        verify_ssl: bool = True,
+        http2: bool = True,
+        pool_limits: Optional[httpx.Limits] = None,
+        response_cache_ttl: Optional[float] = None,
+        large_response_threshold_bytes: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+    ):
+        """
+        Initialize AsyncTokenRouter client
+
+        Args:
+            api_key: API key for TokenRouter. Defaults to TOKENROUTER_API_KEY env var
+            base_url: Base URL for API. Defaults to https://api.tokenrouter.io/api
+            timeout: Request timeout in seconds
+            max_retries: Maximum number of retries for failed requests
+            headers: Additional headers to include in requests
+            verify_ssl: Whether to verify SSL certificates (set False for testing)
+            http2: Whether to use HTTP/2, so concurrent requests (including
+                streams) are multiplexed over one connection
+            pool_limits: Connection pool limits. Defaults to 100 connections,
+                all of which are kept alive for up to 60 seconds between requests
+            response_cache_ttl: Seconds to cache finished responses returned by
+                responses.get(). Disabled by default
+            large_response_threshold_bytes: Decode response bodies larger than
+                this many bytes incrementally while they download, instead of
+                buffering them first. Requires ijson. Disabled by default
+            max_concurrency: Maximum number of non-streaming requests in
+                flight at once; further requests wait for a free slot.
+                Unlimited by default
+        """
+        super().__init__(
+            api_key, base_url, timeout, max_retries, headers,
+            response_cache_ttl, large_response_threshold_bytes,
+        )
+        self.max_concurrency = max_concurrency
+        # Created on first use, inside the event loop that runs the requests
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        # Create HTTP client. Retries are handled by _request; httpx's own
+        # transport does not retry by default.
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=timeout,
+            headers=self._headers,
+            verify=verify_ssl,
+            http2=http2,
+            limits=pool_limits or _DEFAULT_POOL_LIMITS,
+        )
+
+        # Create responses namespace
+        self.responses = AsyncResponsesNamespace(self)
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """Make HTTP request with retries, within the concurrency limit"""
+        if self.max_concurrency is None:
+            return await self._send_request(method, path, json_data, params)
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            return await self._send_request(method, path, json_data, params)
+
+    async def _send_request(
+        self,
+        method: str,
+        path: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """Make HTTP request with retries"""
+        # Build the request, and encode its body, once; retries resend it.
+        # The body is encoded by our own (orjson when available) encoder
+        # rather than httpx's json= argument, which uses the json module
+        request = self._client.build_request(
+            method=method,
+            url=path,
+            content=dumps(json_data) if json_data is not None else None,
+            params=params,
+        )
+        # With a large response threshold, look at the headers before
+        # reading the body, so large bodies can be parsed chunk by chunk
+        incremental = self._large_response_threshold is not None
+        try:
+            for attempt in range(max(self.max_retries, 0) + 1):
+                try:
+                    response = await self._client.send(request, stream=incremental)
+                    if incremental:
+                        try:
+                            if self._is_large_response(response):
+                                decoder = IncrementalObjectDecoder()
+                                async for chunk in response.aiter_bytes():
+                                    decoder.feed(chunk)
+                                return decoder.close()
+                            await response.aread()
+                        finally:
+                            await response.aclose()
+                except httpx.TransportError as e:
+                    wait = (
+                        _retry_error_delay(e, method, attempt)
+                        if attempt < self.max_retries else None
+                    )
+                    if wait is None:
+                        raise
+                    await asyncio.sleep(wait)
+                    continue
+
+                if response.status_code < 400:
+                    content = response.content
+                    # 204 No Content and other empty bodies (typically from
+                    # DELETE) have nothing to decode
+                    if not content:
+                        return {}
+                    return loads(content)
+
+                if attempt < self.max_retries:
+                    wait = _retry_delay(response, attempt)
+                    if wait is not None:
+                        await asyncio.sleep(wait)
+                        continue
+
+                _handle_error_response(response)
+
+        except httpx.TimeoutException:
+            raise APIConnectionError("Request timed out")
+        except httpx.ConnectError as e:
+            raise APIConnectionError(f"Connection failed: {str(e)}")
+        except httpx.HTTPError as e:
+            raise TokenRouterError(f"Request failed: {str(e)}")
+
+    async def _stream(
+        self,
+        method: str,
+        path: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[ResponseStreamEvent]:
+        """Make streaming HTTP request"""
+        try:
+            async with self._client.stream(
+                method=method,
+                url=path,
+                content=dumps(json_data) if json_data is not None else None,
+                params=params,
+                headers=_STREAM_HEADERS,
+            ) as response:
+                if response.status_code >= 400:
+                    await response.aread()
+                    _handle_error_response(response)
+
+                # Uncompressed bodies are read raw, skipping httpx's content
+                # decoding layer
+                if response.headers.get("content-encoding", "identity") == "identity":
+                    chunks = response.aiter_raw()
+                else:
+                    chunks = response.aiter_bytes()
+
+                decoder = _SSEDecoder()
+                feed = decoder.feed
+                async for chunk in chunks:
+                    for event in feed(chunk):
+                        yield event
+                    if decoder.done:
+                        return
+                for event in decoder.close():
+                    yield event
+
+        except httpx.TimeoutException:
+            raise APIConnectionError("Request timed out")
+        except httpx.ConnectError as e:
+            raise APIConnectionError(f"Connection failed: {str(e)}")
+        except httpx.HTTPError as e:
+            raise TokenRouterError(f"Request failed: {str(e)}")
+
+    async def close(self):
+        """Close the HTTP client"""
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+
 class ResponsesNamespace:
     """Namespace for responses operations"""
 
@@ -355,16 +1086,7 @@ class ResponsesNamespace:
         Returns:
             Response object or stream of ResponseStreamEvent
         """
-        # Handle both dict params and keyword arguments
-        if params is not None:
-            # If params provided, use it (could be dict or TypedDict)
-            if isinstance(params, dict):
-                request_params = params
-            else:
-                request_params = dict(params)
-        else:
-            # Use keyword arguments
-            request_params = kwargs
+        request_params = _create_request_params(params, kwargs)
 
         # Check if streaming
         if request_params.get("stream"):
@@ -373,23 +1095,31 @@ class ResponsesNamespace:
         # Regular request
         response_data = self._client._request("POST", "/v1/responses", json_data=request_params)
 
-        # Create Response object
-        response = Response(
-            id=response_data.get("id", ""),
-            object=response_data.get("object", "realtime.response"),
-            created=response_data.get("created"),
-            model=response_data.get("model"),
-            usage=response_data.get("usage"),
-            output=response_data.get("output", []),
-            metadata=response_data.get("metadata"),
-            status=response_data.get("status"),
-            status_details=response_data.get("status_details"),
-        )
+        return Response.from_dict(response_data)
 
-        # Add convenience property output_text
-        response.output_text = self._extract_output_text(response)
+    def create_many(
+        self,
+        params_list: List[Union[ResponsesCreateParams, Dict[str, Any]]],
+        return_exceptions: bool = False,
+    ) -> List[Union[Response, BaseException]]:
+        """
+        Create several model responses concurrently
 
-        return response
+        The requests run together on a background event loop, multiplexed
+        over the client's HTTP/2 connection, so the call takes about as long
+        as the slowest request rather than the sum of all of them.
+
+        Args:
+            params_list: Parameters for each response, as passed to create()
+            return_exceptions: Return failed requests' exceptions in place of
+                their responses instead of raising the first one
+
+        Returns:
+            Responses in the same order as params_list
+        """
+        return self._client._run_async(
+            lambda client: client.responses.create_many(params_list, return_exceptions)
+        )
 
     def get(self, response_id: str) -> Response:
         """
@@ -401,22 +1131,17 @@ class ResponsesNamespace:
         Returns:
             Response object
         """
-        response_data = self._client._request("GET", f"/v1/responses/{response_id}")
+        cache = self._client._response_cache
+        if cache is not None:
+            response = cache.get(response_id)
+            if response is not None:
+                return response
 
-        response = Response(
-            id=response_data.get("id", ""),
-            object=response_data.get("object", "realtime.response"),
-            created=response_data.get("created"),
-            model=response_data.get("model"),
-            usage=response_data.get("usage"),
-            output=response_data.get("output", []),
-            metadata=response_data.get("metadata"),
-            status=response_data.get("status"),
-            status_details=response_data.get("status_details"),
-        )
-
-        response.output_text = self._extract_output_text(response)
+        response_data = self._client._request("GET", f"/v1/responses/{response_id}")
 
+        response = Response.from_dict(response_data)
+        if cache is not None:
+            cache.put(response)
         return response
 
     def delete(self, response_id: str) -> Dict[str, Any]:
@@ -429,6 +1154,8 @@ class ResponsesNamespace:
         Returns:
             Deletion confirmation
         """
+        if self._client._response_cache is not None:
+            self._client._response_cache.discard(response_id)
         return self._client._request("DELETE", f"/v1/responses/{response_id}")
 
     def cancel(self, response_id: str) -> Response:
@@ -441,25 +1168,137 @@ class ResponsesNamespace:
         Returns:
             Updated Response object
         """
+        if self._client._response_cache is not None:
+            self._client._response_cache.discard(response_id)
         response_data = self._client._request("POST", f"/v1/responses/{response_id}/cancel")
 
-        response = Response(
-            id=response_data.get("id", ""),
-            object=response_data.get("object", "realtime.response"),
-            created=response_data.get("created"),
-            model=response_data.get("model"),
-            usage=response_data.get("usage"),
-            output=response_data.get("output", []),
-            metadata=response_data.get("metadata"),
-            status=response_data.get("status"),
-            status_details=response_data.get("status_details"),
+        return Response.from_dict(response_data)
+
+    def list_input_items(self, response_id: str) -> InputItemsList:
+        """
+        List input items for a response
+
+        Args:
+            response_id: The ID of the response
+
+        Returns:
+            InputItemsList object
+        """
+        data = self._client._request("GET", f"/v1/responses/{response_id}/input_items")
+        return data
+
+
+class AsyncResponsesNamespace:
+    """Namespace for asynchronous responses operations"""
+
+    def __init__(self, client: AsyncTokenRouter):
+        self._client = client
+
+    async def create(
+        self,
+        params: Optional[Union[ResponsesCreateParams, Dict[str, Any]]] = None,
+        **kwargs
+    ) -> Union[Response, AsyncIterator[ResponseStreamEvent]]:
+        """
+        Create a model response
+
+        Args:
+            params: Parameters for creating the response (dict or keyword args)
+            **kwargs: Alternative way to pass parameters as keyword arguments
+
+        Returns:
+            Response object or async stream of ResponseStreamEvent
+        """
+        request_params = _create_request_params(params, kwargs)
+
+        # Check if streaming
+        if request_params.get("stream"):
+            return self._client._stream("POST", "/v1/responses", json_data=request_params)
+
+        # Regular request
+        response_data = await self._client._request("POST", "/v1/responses", json_data=request_params)
+
+        return Response.from_dict(response_data)
+
+    async def create_many(
+        self,
+        params_list: List[Union[ResponsesCreateParams, Dict[str, Any]]],
+        return_exceptions: bool = False,
+    ) -> List[Union[Response, BaseException]]:
+        """
+        Create several model responses concurrently
+
+        Args:
+            params_list: Parameters for each response, as passed to create()
+            return_exceptions: Return failed requests' exceptions in place of
+                their responses instead of raising the first one
+
+        Returns:
+            Responses in the same order as params_list
+        """
+        request_params_list = [_create_request_params(params, {}) for params in params_list]
+        if any(request_params.get("stream") for request_params in request_params_list):
+            raise InvalidRequestError("create_many does not support streaming responses")
+
+        return await asyncio.gather(
+            *(self.create(request_params) for request_params in request_params_list),
+            return_exceptions=return_exceptions,
         )
 
-        response.output_text = self._extract_output_text(response)
+    async def get(self, response_id: str) -> Response:
+        """
+        Get a response by ID
+
+        Args:
+            response_id: The ID of the response to retrieve
+
+        Returns:
+            Response object
+        """
+        cache = self._client._response_cache
+        if cache is not None:
+            response = cache.get(response_id)
+            if response is not None:
+                return response
+
+        response_data = await self._client._request("GET", f"/v1/responses/{response_id}")
 
+        response = Response.from_dict(response_data)
+        if cache is not None:
+            cache.put(response)
         return response
 
-    def list_input_items(self, response_id: str) -> InputItemsList:
+    async def delete(self, response_id: str) -> Dict[str, Any]:
+        """
+        Delete a response
+
+        Args:
+            response_id: The ID of the response to delete
+
+        Returns:
+            Deletion confirmation
+        """
+        if self._client._response_cache is not None:
+            self._client._response_cache.discard(response_id)
+        return await self._client._request("DELETE", f"/v1/responses/{response_id}")
+
+    async def cancel(self, response_id: str) -> Response:
+        """
+        Cancel a background response
+
+        Args:
+            response_id: The ID of the response to cancel
+
+        Returns:
+            Updated Response object
+        """
+        if self._client._response_cache is not None:
+            self._client._response_cache.discard(response_id)
+        response_data = await self._client._request("POST", f"/v1/responses/{response_id}/cancel")
+
+        return Response.from_dict(response_data)
+
+    async def list_input_items(self, response_id: str) -> InputItemsList:
         """
         List input items for a response
 
@@ -469,15 +1308,5 @@ class ResponsesNamespace:
         Returns:
             InputItemsList object
         """
-        data = self._client._request("GET", f"/v1/responses/{response_id}/input_items")
+        data = await self._client._request("GET", f"/v1/responses/{response_id}/input_items")
         return data
-
-    def _extract_output_text(self, response: Response) -> str:
-        """Extract text from response output"""
-        texts = []
-        for item in response.output or []:
-            if item.get("type") == "message" and item.get("content"):
-                for content in item["content"]:
-                    if content.get("type") == "output_text" and content.get("text"):
-                        texts.append(content["text"])
-        return "".join(texts)
@@ -2,7 +2,7 @@
 TokenRouter SDK Exceptions
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Mapping
 
 
 class TokenRouterError(Exception):
@@ -13,7 +13,7 @@ class TokenRouterError(Exception):
         message: str,
         status_code: Optional[int] = None,
         response: Optional[Dict[str, Any]] = None,
-        headers: Optional[Dict[str, str]] = None,
+        headers: Optional[Mapping[str, str]] = None,
     ):
         super().__init__(message)
         self.message = message
@@ -21,6 +21,20 @@ class TokenRouterError(Exception):
         self.response = response
         self.headers = headers
 
+    @property
+    def headers(self) -> Optional[Dict[str, str]]:
+        """Response headers, copied into a dict on first access"""
+        headers = self._headers
+        if headers is not None and type(headers) is not dict:
+            headers = self._headers = dict(headers)
+        return headers
+
+    @headers.setter
+    def headers(self, value: Optional[Mapping[str, str]]) -> None:
+        # Usually the response's httpx.Headers; most errors are caught
+        # without their headers ever being read, so keep it as-is until then
+        self._headers = value
+
 
 class AuthenticationError(TokenRouterError):
     """Raised when authentication fails"""
@@ -35,7 +49,7 @@ class RateLimitError(TokenRouterError):
         message: str,
         status_code: Optional[int] = None,
         response: Optional[Dict[str, Any]] = None,
-        headers: Optional[Dict[str, str]] = None,
+        headers: Optional[Mapping[str, str]] = None,
         retry_after: Optional[int] = None,
     ):
         super().__init__(message, status_code, response, headers)
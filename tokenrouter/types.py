@@ -2,25 +2,84 @@
 Type definitions for TokenRouter SDK
 """
 
-from typing import Dict, List, Optional, Any, Union, Literal, TypedDict
-from dataclasses import dataclass, field
+from __future__ import annotations
 
+from typing import Dict, FrozenSet, List, Mapping, NamedTuple, Optional, Any, Tuple, Union, TypedDict, get_type_hints
+from dataclasses import dataclass, field, fields
 
-class ResponsesCreateParams(TypedDict, total=False):
-    """Parameters for creating a response"""
-    input: Union[str, List["InputItem"]]  # Required
-    model: Optional[str]
-    instructions: Optional[str]
-    max_output_tokens: Optional[int]
-    temperature: Optional[float]
-    top_p: Optional[float]
-    stream: Optional[bool]
-    tools: Optional[List["Tool"]]
-    tool_choice: Optional[Union[str, Dict[str, Any]]]
-    text: Optional[Dict[str, Any]]
-    previous_response_id: Optional[str]
-    store: Optional[bool]
-    metadata: Optional[Dict[str, Any]]
+from ._json import dumps, loads
+from .errors import InvalidRequestError
+
+__all__ = [
+    "ContentItem",
+    "InputItem",
+    "FunctionCall",
+    "ToolCall",
+    "OutputItem",
+    "FunctionTool",
+    "Tool",
+    "ResponsesCreateParams",
+    "TYPE_MESSAGE",
+    "TYPE_TEXT",
+    "TYPE_INPUT_TEXT",
+    "TYPE_OUTPUT_TEXT",
+    "TYPE_FUNCTION",
+    "TYPE_FUNCTION_CALL",
+    "TYPE_TOOL_CALL",
+    "CONTENT_ITEM_KEYS",
+    "INPUT_ITEM_KEYS",
+    "FUNCTION_CALL_KEYS",
+    "TOOL_CALL_KEYS",
+    "OUTPUT_ITEM_KEYS",
+    "FUNCTION_TOOL_KEYS",
+    "TOOL_KEYS",
+    "RESPONSES_CREATE_PARAMS_KEYS",
+    "check_keys",
+    "Usage",
+    "Response",
+    "ResponseDelta",
+    "ResponseStreamEvent",
+    "InputItemsList",
+    "hints_for",
+    "json_default",
+]
+
+
+def _slotted(cls=None, *, properties: Tuple[str, ...] = ()):
+    """
+    Rebuild a dataclass with __slots__ (dataclass(slots=True) needs Python 3.10)
+
+    Fields named in ``properties`` are implemented by a property set on the
+    class afterwards, which stores the value in an underscored slot.
+    """
+    if cls is None:
+        return lambda cls: _slotted(cls, properties=properties)
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in fields(cls))
+    # __weakref__ keeps the classes weak-referenceable, as plain dataclasses are
+    cls_dict["__slots__"] = tuple(
+        name for name in field_names if name not in properties
+    ) + tuple("_" + name for name in properties) + ("__weakref__",)
+    for name in field_names:
+        # Class-level defaults would shadow the slot descriptors; the
+        # generated __init__ already carries them
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted_cls.__qualname__ = cls.__qualname__
+    return slotted_cls
+
+
+class ContentItem(TypedDict):
+    """
+    Content item within input or output
+
+    The text is always carried in "text"; type says whether it is
+    "input_text", "output_text" or a streamed "text" part.
+    """
+    type: str
+    text: Optional[str]
 
 
 class InputItem(TypedDict):
@@ -30,15 +89,20 @@ class InputItem(TypedDict):
     text: Optional[str]
     role: Optional[str]
     audio: Optional[Dict[str, Any]]
-    content: Optional[List["ContentItem"]]
+    content: Optional[List[ContentItem]]
 
 
-class ContentItem(TypedDict):
-    """Content item within input or output"""
+class FunctionCall(TypedDict):
+    """Function call details"""
+    name: str
+    arguments: str
+
+
+class ToolCall(TypedDict):
+    """Tool call in output"""
     type: str
-    text: Optional[str]
-    input_text: Optional[Dict[str, Any]]
-    output_text: Optional[Dict[str, Any]]
+    id: Optional[str]
+    function: Optional[FunctionCall]
 
 
 class OutputItem(TypedDict):
@@ -47,45 +111,108 @@ class OutputItem(TypedDict):
     id: Optional[str]
     index: Optional[int]
     content: Optional[List[ContentItem]]
-    tool_calls: Optional[List["ToolCall"]]
-
-
-class ToolCall(TypedDict):
-    """Tool call in output"""
-    type: str
-    id: Optional[str]
-    function: Optional["FunctionCall"]
+    tool_calls: Optional[List[ToolCall]]
 
 
-class FunctionCall(TypedDict):
-    """Function call details"""
+class FunctionTool(TypedDict):
+    """Function tool definition"""
     name: str
-    arguments: str
+    description: Optional[str]
+    parameters: Optional[Dict[str, Any]]
 
 
 class Tool(TypedDict):
     """Tool definition"""
     type: str
-    function: Optional["FunctionTool"]
+    function: Optional[FunctionTool]
 
 
-class FunctionTool(TypedDict):
-    """Function tool definition"""
-    name: str
-    description: Optional[str]
-    parameters: Optional[Dict[str, Any]]
+class ResponsesCreateParams(TypedDict, total=False):
+    """Parameters for creating a response"""
+    input: Union[str, List[InputItem]]  # Required
+    model: Optional[str]
+    instructions: Optional[str]
+    max_output_tokens: Optional[int]
+    temperature: Optional[float]
+    top_p: Optional[float]
+    stream: Optional[bool]
+    tools: Optional[List[Tool]]
+    tool_choice: Optional[Union[str, Dict[str, Any]]]
+    text: Optional[Dict[str, Any]]
+    previous_response_id: Optional[str]
+    store: Optional[bool]
+    metadata: Optional[Dict[str, Any]]
 
 
-class Usage(TypedDict):
-    """Usage statistics"""
-    input_tokens: int
-    output_tokens: int
-    total_tokens: int
-    input_token_details: Optional[Dict[str, Any]]
-    output_token_details: Optional[Dict[str, Any]]
+# Values of the "type" discriminator of items and content parts, defined
+# once so the SDK and callers compare against the same constants
+TYPE_MESSAGE = "message"
+TYPE_TEXT = "text"
+TYPE_INPUT_TEXT = "input_text"
+TYPE_OUTPUT_TEXT = "output_text"
+TYPE_FUNCTION = "function"
+TYPE_FUNCTION_CALL = "function_call"
+TYPE_TOOL_CALL = "tool_call"
 
 
-@dataclass
+# Key sets of the request and response TypedDicts, for check_keys()
+CONTENT_ITEM_KEYS = frozenset(ContentItem.__annotations__)
+INPUT_ITEM_KEYS = frozenset(InputItem.__annotations__)
+FUNCTION_CALL_KEYS = frozenset(FunctionCall.__annotations__)
+TOOL_CALL_KEYS = frozenset(ToolCall.__annotations__)
+OUTPUT_ITEM_KEYS = frozenset(OutputItem.__annotations__)
+FUNCTION_TOOL_KEYS = frozenset(FunctionTool.__annotations__)
+TOOL_KEYS = frozenset(Tool.__annotations__)
+RESPONSES_CREATE_PARAMS_KEYS = frozenset(ResponsesCreateParams.__annotations__)
+
+
+def check_keys(data: Mapping[str, Any], keys: FrozenSet[str], name: str = "item") -> None:
+    """
+    Raise InvalidRequestError if ``data`` has keys outside ``keys``
+
+    The TypedDicts above only describe request shapes for type checkers and
+    nothing is validated at runtime. Callers that want a cheap structural
+    check can pass a dict and one of the *_KEYS sets, for example
+    ``check_keys(item, INPUT_ITEM_KEYS, "input item")``.
+    """
+    extra = data.keys() - keys
+    if extra:
+        raise InvalidRequestError(
+            f"Unknown {name} keys: {', '.join(sorted(extra))}"
+        )
+
+
+class Usage(NamedTuple):
+    """
+    Usage statistics
+
+    Fields are read as attributes or unpacked like a tuple. This is not a
+    dict: indexing by name, get(), keys() and "in" do not look up field
+    names, so use attributes or usage._asdict(). Token counts that are
+    missing or null in the API data are 0.
+    """
+    input_tokens: int = 0
+    output_tokens: int = 0
+    total_tokens: int = 0
+    input_token_details: Optional[Mapping[str, Any]] = None
+    output_token_details: Optional[Mapping[str, Any]] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> Usage:
+        """Build Usage from API usage data, ignoring unknown keys"""
+        # Counts that are missing or null both become 0
+        g = data.get
+        return cls(
+            g("input_tokens") or 0,
+            g("output_tokens") or 0,
+            g("total_tokens") or 0,
+            g("input_token_details"),
+            g("output_token_details"),
+        )
+
+
+@_slotted(properties=("output_text",))
+@dataclass(init=False)
 class Response:
     """Response from the API"""
     id: str
@@ -94,32 +221,301 @@ class Response:
     model: Optional[str] = None
     usage: Optional[Usage] = None
     output: List[OutputItem] = field(default_factory=list)
-    metadata: Optional[Dict[str, Any]] = None
+    metadata: Optional[Mapping[str, Any]] = None
     status: Optional[str] = None
-    status_details: Optional[Dict[str, Any]] = None
-    output_text: Optional[str] = None  # Convenience property
+    status_details: Optional[Mapping[str, Any]] = None
+    output_text: Optional[str] = None  # Convenience property, computed on first access
+
+    def __init__(
+        self,
+        id: str,
+        object: str = "realtime.response",
+        created: Optional[int] = None,
+        model: Optional[str] = None,
+        usage: Optional[Usage] = None,
+        output: Optional[List[OutputItem]] = None,
+        metadata: Optional[Mapping[str, Any]] = None,
+        status: Optional[str] = None,
+        status_details: Optional[Mapping[str, Any]] = None,
+        output_text: Optional[str] = None,
+    ):
+        # Written out rather than generated: the dataclass __init__ checks a
+        # default-factory sentinel for output and sets output_text through
+        # its property, and every parsed response is built here
+        self.id = id
+        self.object = object
+        self.created = created
+        self.model = model
+        self.usage = usage
+        self.output = [] if output is None else output
+        self.metadata = metadata
+        self.status = status
+        self.status_details = status_details
+        self._output_text = output_text
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> Response:
+        """Build a Response from API response data"""
+        # Bind data.get once; it is called for every field
+        g = data.get
+        usage = g("usage")
+        return cls(
+            id=g("id", ""),
+            object=g("object", "realtime.response"),
+            created=g("created"),
+            model=g("model"),
+            usage=Usage.from_dict(usage) if usage is not None else None,
+            output=g("output"),
+            metadata=g("metadata"),
+            status=g("status"),
+            status_details=g("status_details"),
+        )
 
+    @classmethod
+    def from_json(cls, data: Union[bytes, bytearray, str]) -> Response:
+        """Build a Response from a JSON-encoded API response body"""
+        return cls.from_dict(loads(data))
 
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Plain dict of the fields, as dataclasses.asdict() gives but without
+        deep-copying; usage is converted to a dict as well
+        """
+        usage = self.usage
+        return {
+            "id": self.id,
+            "object": self.object,
+            "created": self.created,
+            "model": self.model,
+            "usage": usage._asdict() if usage is not None else None,
+            "output": self.output,
+            "metadata": self.metadata,
+            "status": self.status,
+            "status_details": self.status_details,
+            "output_text": self.output_text,
+        }
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Encode the response as compact UTF-8 JSON
+
+        orjson encodes the dataclass directly; the stdlib fallback goes
+        through json_default. Neither builds the deep copy that
+        json.dumps(dataclasses.asdict(response)) would.
+        """
+        return dumps(self, default=json_default)
+
+
+def _extract_output_text(output: List[OutputItem]) -> str:
+    """Extract text from response output"""
+    # Missing or empty text joins as "", so each content part needs a
+    # single lookup for its text instead of a test and then a fetch
+    return "".join(
+        content.get("text") or ""
+        for item in output or ()
+        if item.get("type") == TYPE_MESSAGE
+        for content in item.get("content") or ()
+        if content.get("type") == TYPE_OUTPUT_TEXT
+    )
+
+
+def _get_output_text(self: Response) -> str:
+    text = self._output_text
+    if text is None:
+        text = self._output_text = _extract_output_text(self.output)
+    return text
+
+
+def _set_output_text(self: Response, value: Optional[str]) -> None:
+    self._output_text = value
+
+
+# output_text is only joined from output when it is first read. __init__
+# stores an explicit value straight in the slot, so it still wins.
+Response.output_text = property(_get_output_text, _set_output_text)
+
+
+@_slotted(properties=("output",))
 @dataclass
 class ResponseDelta:
-    """Delta update for streaming response"""
+    """
+    Delta update for streaming response
+
+    Plain text deltas set text_delta to the appended text. Their output,
+    a message item wrapping that text, is only built if it is read.
+    """
     output: Optional[List[OutputItem]] = None
+    text_delta: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict of the fields"""
+        return {"output": self.output, "text_delta": self.text_delta}
+
 
+def _get_delta_output(self: ResponseDelta) -> Optional[List[OutputItem]]:
+    output = self._output
+    if output is None and self.text_delta is not None:
+        output = self._output = [
+            {"type": TYPE_MESSAGE, "content": [{"type": TYPE_TEXT, "text": self.text_delta}]}
+        ]
+    return output
 
+
+def _set_delta_output(self: ResponseDelta, value: Optional[List[OutputItem]]) -> None:
+    self._output = value
+
+
+ResponseDelta.output = property(_get_delta_output, _set_delta_output)
+
+
+@_slotted
 @dataclass
 class ResponseStreamEvent:
     """Event in streaming response"""
+    # Positional class patterns match on the event type alone, as in
+    # case ResponseStreamEvent("response.delta"), on every Python version
+    __match_args__ = ("type",)
+
     type: str
     response: Optional[Response] = None
     delta: Optional[ResponseDelta] = None
     item: Optional[OutputItem] = None
     event_id: Optional[str] = None
     rate_limits: Optional[List[Dict[str, Any]]] = None
-    metadata: Optional[Dict[str, Any]] = None
+    metadata: Optional[Mapping[str, Any]] = None
     raw: Optional[Any] = None
 
+    @classmethod
+    def bare(cls, event_type: str, event_id: Optional[str] = None) -> ResponseStreamEvent:
+        """
+        Event carrying nothing but its type (and SSE id)
+
+        Events without an id are shared by every stream in the process, so
+        they are read-only: setting an attribute raises AttributeError.
+        """
+        if event_id is not None:
+            return cls(type=event_type, event_id=event_id)
+        event = _BARE_EVENTS.get(event_type)
+        if event is None:
+            event = _SharedStreamEvent(type=event_type)
+            # Event types come from the server; keep the pool bounded
+            if len(_BARE_EVENTS) < _BARE_EVENTS_MAX:
+                _BARE_EVENTS[event_type] = event
+        return event
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict of the fields, with the response and delta converted too"""
+        response = self.response
+        delta = self.delta
+        return {
+            "type": self.type,
+            "response": response.to_dict() if response is not None else None,
+            "delta": delta.to_dict() if delta is not None else None,
+            "item": self.item,
+            "event_id": self.event_id,
+            "rate_limits": self.rate_limits,
+            "metadata": self.metadata,
+            "raw": self.raw,
+        }
+
+
+_STREAM_EVENT_FIELDS = tuple(f.name for f in fields(ResponseStreamEvent))
+
+
+# A dataclass in its own right so orjson still encodes it natively
+@dataclass(init=False, repr=False, eq=False)
+class _SharedStreamEvent(ResponseStreamEvent):
+    """Read-only stream event handed out by ResponseStreamEvent.bare()"""
+    __slots__ = ()
+    __match_args__ = ResponseStreamEvent.__match_args__
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        # Built through the regular __init__, then copied in past the
+        # read-only __setattr__; this also keeps dataclasses.replace() working
+        template = ResponseStreamEvent(*args, **kwargs)
+        for name in _STREAM_EVENT_FIELDS:
+            object.__setattr__(self, name, getattr(template, name))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(
+            f"shared {self.type!r} events are read-only; "
+            "use dataclasses.replace() to get a modified copy"
+        )
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"shared {self.type!r} events are read-only")
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, ResponseStreamEvent):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in _STREAM_EVENT_FIELDS)
+
+    def __repr__(self) -> str:
+        # Shown as the public class; this subclass is an implementation detail
+        fields_repr = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name in _STREAM_EVENT_FIELDS
+        )
+        return f"ResponseStreamEvent({fields_repr})"
+
+    def __reduce__(self):
+        # The default copy/pickle protocol restores slots via setattr
+        return (ResponseStreamEvent.bare, (self.type,))
+
+
+# Shared events that carry nothing but their type, see ResponseStreamEvent.bare
+_BARE_EVENTS: Dict[str, ResponseStreamEvent] = {}
+_BARE_EVENTS_MAX = 64
+
 
 class InputItemsList(TypedDict):
     """List of input items"""
     object: str
     data: List[InputItem]
+
+
+_HINTS_CACHE: Dict[type, Dict[str, Any]] = {}
+
+
+def hints_for(cls: type) -> Dict[str, Any]:
+    """
+    Resolved type hints of one of the types in this module
+
+    With postponed annotations every get_type_hints() call re-evaluates the
+    annotation strings. The result is resolved on first use and cached, so
+    schema generators that ask repeatedly share one mapping; treat it as
+    read-only.
+    """
+    hints = _HINTS_CACHE.get(cls)
+    if hints is None:
+        hints = _HINTS_CACHE[cls] = get_type_hints(cls)
+    return hints
+
+
+# Field names of the dataclasses json_default encodes
+_JSON_FIELDS: Dict[type, Tuple[str, ...]] = {
+    cls: tuple(f.name for f in fields(cls))
+    for cls in (Response, ResponseDelta, ResponseStreamEvent, _SharedStreamEvent)
+}
+
+
+def json_default(obj: Any) -> Any:
+    """
+    ``default`` hook for orjson.dumps() and json.dumps()
+
+    Encodes Usage as an object rather than an array, and the response and
+    event dataclasses as a shallow dict of their fields, for encoders that
+    do not handle dataclasses themselves. Nested values are passed back to
+    the encoder, so no intermediate copy of the whole tree is built.
+    """
+    if isinstance(obj, Usage):
+        return obj._asdict()
+    names = _JSON_FIELDS.get(type(obj))
+    if names is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    data = {name: getattr(obj, name) for name in names}
+    usage = data.get("usage")
+    if usage is not None:
+        # json.dumps encodes tuples itself, so it would never hand usage
+        # back to this hook
+        data["usage"] = usage._asdict()
+    return data